@@ -0,0 +1,93 @@
+"""セル座標変換モジュール
+
+"A1" 形式のセル座標を行列インデックスに変換する。
+セル値抽出と画像判定の両方から利用する。
+"""
+import string
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+# 列文字（A〜ZZZ）→ 列インデックス（0-indexed）の変換表
+# 列文字を1文字ずつ26進数として計算せず、1回の辞書参照で変換する
+_COLUMN_INDEXES: Dict[str, int] = {
+    "".join(letters): index
+    for index, letters in enumerate(
+        letters
+        for length in (1, 2, 3)
+        for letters in product(string.ascii_uppercase, repeat=length)
+    )
+}
+
+# 行番号として扱う文字（半角数字のみ）
+_DIGITS = "0123456789"
+
+# 解析済みのセル位置 (row_index, col_index)。不正な座標は None で表す
+CellPosition = Optional[Tuple[int, int]]
+
+
+@lru_cache(maxsize=512)
+def parse_cell_address(cell_address: str) -> Tuple[int, int]:
+    """セル座標（例: A1, B2）を行列インデックスに変換
+
+    同じセル座標はファイルごとに繰り返し変換されるため、結果をキャッシュする。
+
+    Args:
+        cell_address: セル座標（例: "A1", "B2"）
+
+    Returns:
+        (row_index, col_index) のタプル（0-indexed）
+
+    Raises:
+        ValueError: セル座標の形式が不正な場合
+    """
+    address = cell_address.upper()
+
+    # 末尾の半角数字を行番号、残りを列文字として分割する
+    column_part = address.rstrip(_DIGITS)
+    row_part = address[len(column_part):]
+
+    col_index = _COLUMN_INDEXES.get(column_part)
+    if col_index is None or not row_part:
+        raise ValueError(f"不正なセル座標です: {cell_address}")
+
+    # 行・列ともに0-indexedに変換
+    return (int(row_part) - 1, col_index)
+
+
+def parse_cell_positions(cell_list: List[str]) -> List[CellPosition]:
+    """セル座標のリストを行列インデックスのリストに変換
+
+    設定読み込み時に1回だけ変換しておき、ファイルごとの処理では変換済みの値を使う。
+
+    Args:
+        cell_list: セル座標のリスト（例: ["A1", "B2"]）
+
+    Returns:
+        (row_index, col_index) のリスト（0-indexed、不正な座標は None）
+    """
+    positions: List[CellPosition] = []
+    for cell_address in cell_list:
+        try:
+            positions.append(parse_cell_address(cell_address))
+        except ValueError:
+            positions.append(None)
+    return positions
+
+
+def group_positions_by_row(positions: List[CellPosition]) -> Dict[int, List[Tuple[int, int]]]:
+    """セル位置を行ごとにまとめる
+
+    Args:
+        positions: セル位置のリスト（不正な座標は None）
+
+    Returns:
+        行インデックス → (列インデックス, 元のリストでの位置) のリストの辞書（None は除外）
+    """
+    targets_by_row: Dict[int, List[Tuple[int, int]]] = {}
+    for i, position in enumerate(positions):
+        if position is None:
+            continue
+        row, col = position
+        targets_by_row.setdefault(row, []).append((col, i))
+    return targets_by_row
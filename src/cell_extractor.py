@@ -2,11 +2,45 @@
 
 ExcelファイルおよびCSVファイルから指定されたセルの値を抽出する。
 """
+import csv
+import numpy as np
 import pandas as pd
 import openpyxl
+import xlrd
 from pathlib import Path
-from typing import List, Any
-import re
+from typing import List, Any, Optional
+from src.cell_address import CellPosition, group_positions_by_row, parse_cell_positions
+from src.xlsx_reader import XlsxReader
+
+# ファイル形式の判定に使用する先頭バイト
+_OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # .xls（BIFF形式）
+_ZIP_SIGNATURE = b"PK\x03\x04"  # .xlsx（拡張子だけ .xls のファイルを含む）
+
+
+def extract_cells(
+    file_path: Path,
+    cell_list: List[str],
+    sheet_name: str = None,
+    positions: Optional[List[CellPosition]] = None,
+    reader: Optional[XlsxReader] = None
+) -> List[Any]:
+    """探索済みファイルから指定されたセルの値を抽出
+
+    FileSearcher などで存在・拡張子を確認済みのファイルを対象とし、
+    CellExtractor の初期化時の確認を省略する。
+
+    Args:
+        file_path: 対象ファイルのパス（.xlsx, .xls, .csv）
+        cell_list: セル座標のリスト（例: ["A1", "B2", "C3"]）
+        sheet_name: シート名（Excelファイルのみ有効、指定しない場合は最初のシート）
+        positions: cell_list を変換済みのセル位置のリスト（省略時はここで変換）
+        reader: 開いている軽量リーダー（.xlsxのみ有効、クローズは呼び出し元が行う）
+
+    Returns:
+        抽出されたセル値のリスト
+    """
+    extractor = CellExtractor(file_path, validate=False, reader=reader)
+    return extractor.extract_cells(cell_list, sheet_name, positions=positions)
 
 
 class CellExtractor:
@@ -15,121 +49,237 @@ class CellExtractor:
     Attributes:
         file_path (Path): 対象ファイルのパス
         file_extension (str): ファイルの拡張子
+        reader (Optional[XlsxReader]): 呼び出し元で開いている軽量リーダー（共有用）
     """
 
     # サポートする拡張子
     SUPPORTED_EXTENSIONS = {'.xlsx', '.xls', '.csv'}
 
-    def __init__(self, file_path: Path):
+    def __init__(
+        self,
+        file_path: Path,
+        validate: bool = True,
+        reader: Optional[XlsxReader] = None
+    ):
         """セル値抽出の初期化
 
         Args:
             file_path: 対象ファイルのパス
+            validate: ファイルの存在・拡張子を確認するか
+                （探索時に確認済みのファイルではFalseにして stat を省略できる）
+            reader: 開いている軽量リーダー（.xlsxのみ有効）。
+                指定した場合はZIPを開き直さずに使用し、クローズは呼び出し元が行う
 
         Raises:
             FileNotFoundError: ファイルが存在しない場合
             ValueError: サポートされていないファイル形式の場合
         """
-        if not file_path.exists():
+        if validate and not file_path.exists():
             raise FileNotFoundError(
                 f"エラー: ファイルが見つかりません: {file_path}"
             )
 
         self.file_path = file_path
         self.file_extension = file_path.suffix.lower()
+        self.reader = reader
 
-        if self.file_extension not in self.SUPPORTED_EXTENSIONS:
+        if validate and self.file_extension not in self.SUPPORTED_EXTENSIONS:
             raise ValueError(
                 f"エラー: サポートされていないファイル形式です: {self.file_extension}"
             )
 
-    def extract_cells(self, cell_list: List[str], sheet_name: str = None) -> List[Any]:
+    def extract_cells(
+        self,
+        cell_list: List[str],
+        sheet_name: str = None,
+        positions: Optional[List[CellPosition]] = None
+    ) -> List[Any]:
         """指定されたセルの値を抽出
 
+        数式セルは再計算せず、ファイルに保存されている計算結果（キャッシュ値）を返す。
+        Excel・LibreOffice で保存されていないファイル（openpyxl 等で生成したファイル）は
+        キャッシュ値を持たないため、数式セルは空文字列になる。
+
         Args:
             cell_list: セル座標のリスト（例: ["A1", "B2", "C3"]）
             sheet_name: シート名（Excelファイルのみ有効、指定しない場合は最初のシート）
+            positions: cell_list を変換済みのセル位置のリスト（省略時はここで変換）
 
         Returns:
             抽出されたセル値のリスト
         """
+        if positions is None:
+            positions = parse_cell_positions(cell_list)
+
         if self.file_extension == '.csv':
-            return self._extract_from_csv(cell_list)
+            return self._extract_from_csv(positions)
         else:
-            return self._extract_from_excel(cell_list, sheet_name)
+            return self._extract_from_excel(positions, sheet_name)
 
-    def _extract_from_excel(self, cell_list: List[str], sheet_name: str = None) -> List[Any]:
+    def _extract_from_excel(self, positions: List[CellPosition], sheet_name: str = None) -> List[Any]:
         """Excelファイルからセル値を抽出
 
         Args:
-            cell_list: セル座標のリスト
+            positions: セル位置のリスト（不正な座標は None）
             sheet_name: シート名（指定しない場合は最初のシート）
 
         Returns:
             抽出されたセル値のリスト
         """
-        # .xls形式の場合はpandasで読み込む（openpyxlは.xlsをサポートしない）
+        # .xls形式の場合はファイルの中身に応じて読み込む（openpyxlは.xlsをサポートしない）
         if self.file_extension == '.xls':
-            return self._extract_from_excel_with_pandas(cell_list, sheet_name)
+            return self._extract_from_xls(positions, sheet_name)
 
+        # 軽量リーダーで必要なセルだけを読み込む
         try:
-            # openpyxlでExcelファイルを開く（.xlsx形式）
-            workbook = openpyxl.load_workbook(self.file_path, data_only=True)
-
-            # シート名が指定されている場合はそのシートを、指定がない場合は最初のシートを使用
-            if sheet_name:
-                sheet = workbook[sheet_name]
-            else:
-                sheet = workbook.worksheets[0]
-
-            values = []
-            for cell_address in cell_list:
-                try:
-                    cell_value = sheet[cell_address].value
-                    # Noneの場合は空文字列に変換
-                    values.append(cell_value if cell_value is not None else "")
-                except Exception:
-                    # セル範囲外などのエラーの場合は空文字列
-                    values.append("")
-
-            workbook.close()
-            return values
+            return self._extract_with_xlsx_reader(positions, sheet_name)
+        except Exception:
+            # 軽量リーダーで解釈できない場合はopenpyxlで読み直す
+            pass
+
+        try:
+            # 値の読み取りのみのため read_only モードでストリーミング解析する（.xlsx形式）
+            workbook = openpyxl.load_workbook(
+                self.file_path, data_only=True, read_only=True, keep_links=False
+            )
+
+            try:
+                # シート名が指定されている場合はそのシートを、指定がない場合は最初のシートを使用
+                if sheet_name:
+                    sheet = workbook[sheet_name]
+                else:
+                    sheet = workbook.worksheets[0]
+
+                return self._read_cells_from_sheet(sheet, positions)
+            finally:
+                workbook.close()
 
         except Exception as e:
             raise RuntimeError(
                 f"エラー: Excelファイルの読み込みに失敗しました: {self.file_path} - {str(e)}"
             )
 
-    def _extract_from_excel_with_pandas(self, cell_list: List[str], sheet_name: str = None) -> List[Any]:
-        """Excelファイル(.xls)からpandasでセル値を抽出
+    def _extract_with_xlsx_reader(self, positions: List[CellPosition], sheet_name: str = None) -> List[Any]:
+        """軽量リーダー（XlsxReader）でセル値を抽出
 
         Args:
-            cell_list: セル座標のリスト
+            positions: セル位置のリスト（不正な座標は None）
+            sheet_name: シート名（指定しない場合は最初のシート）
+
+        Returns:
+            抽出されたセル値のリスト（空セル・範囲外は空文字列）
+        """
+        if self.reader is not None:
+            values = self.reader.read_positions(positions, sheet_name)
+        else:
+            with XlsxReader(self.file_path) as reader:
+                values = reader.read_positions(positions, sheet_name)
+
+        # Noneの場合は空文字列に変換
+        return [value if value is not None else "" for value in values]
+
+    def _read_cells_from_sheet(self, sheet, positions: List[CellPosition]) -> List[Any]:
+        """ワークシートから指定セルの値を読み取る
+
+        read_only モードのワークシートはセル座標によるランダムアクセスが遅いため、
+        対象セルを含む最大行までを iter_rows で1回だけ走査して値を取り出す。
+
+        Args:
+            sheet: openpyxlのワークシート（通常・read_onlyのどちらでも可）
+            positions: セル位置のリスト（不正な座標は None）
+
+        Returns:
+            抽出されたセル値のリスト（空セル・範囲外・不正な座標は空文字列）
+        """
+        values: List[Any] = [""] * len(positions)
+
+        # 行番号ごとに (列番号, 結果の格納位置) をまとめる（不正なセル座標は空文字列のまま）
+        targets_by_row = group_positions_by_row(positions)
+
+        if not targets_by_row:
+            return values
+
+        min_row = min(targets_by_row)
+        max_row = max(targets_by_row)
+        max_col = max(col for targets in targets_by_row.values() for col, _ in targets)
+
+        rows = sheet.iter_rows(
+            min_row=min_row + 1, max_row=max_row + 1,
+            min_col=1, max_col=max_col + 1,
+            values_only=True
+        )
+        for row_index, row_values in enumerate(rows, start=min_row):
+            for col, i in targets_by_row.get(row_index, ()):
+                if col < len(row_values) and row_values[col] is not None:
+                    values[i] = row_values[col]
+
+        return values
+
+    def _extract_from_xls(self, positions: List[CellPosition], sheet_name: str = None) -> List[Any]:
+        """Excelファイル(.xls)からセル値を抽出
+
+        先頭バイトでファイル形式を判定し、BIFF形式は xlrd で必要なセルのみ、
+        中身がXLSX形式のファイルは軽量リーダーで読み込む。
+        どちらにも該当しない場合はpandasで読み込む。
+
+        Args:
+            positions: セル位置のリスト（不正な座標は None）
             sheet_name: シート名（指定しない場合は最初のシート）
 
         Returns:
             抽出されたセル値のリスト
         """
         try:
-            # pandasでExcelファイルを読み込む（ヘッダーなし）
-            # sheet_nameが指定されている場合はそのシートを、指定がない場合は最初のシート(0)を使用
-            sheet_param = sheet_name if sheet_name else 0
-            df = pd.read_excel(self.file_path, sheet_name=sheet_param, header=None)
+            with self.file_path.open("rb") as f:
+                signature = f.read(len(_OLE2_SIGNATURE))
+        except OSError as e:
+            raise RuntimeError(
+                f"エラー: Excelファイルの読み込みに失敗しました: {self.file_path} - {str(e)}"
+            )
+
+        if signature.startswith(_OLE2_SIGNATURE):
+            return self._extract_with_xlrd(positions, sheet_name)
+
+        if signature.startswith(_ZIP_SIGNATURE):
+            try:
+                return self._extract_with_xlsx_reader(positions, sheet_name)
+            except Exception:
+                # 軽量リーダーで解釈できない場合はpandasで読み直す
+                pass
+
+        return self._extract_from_excel_with_pandas(positions, sheet_name)
+
+    def _extract_with_xlrd(self, positions: List[CellPosition], sheet_name: str = None) -> List[Any]:
+        """BIFF形式の.xlsファイルから xlrd でセル値を抽出
+
+        DataFrameを作成せず、対象シートのみを読み込んで指定セルの値を直接参照する。
+
+        Args:
+            positions: セル位置のリスト（不正な座標は None）
+            sheet_name: シート名（指定しない場合は最初のシート）
+
+        Returns:
+            抽出されたセル値のリスト（空セル・エラー値・範囲外・不正な座標は空文字列）
+        """
+        values: List[Any] = [""] * len(positions)
 
-            values = []
-            for cell_address in cell_list:
-                row, col = self._parse_cell_address(cell_address)
-                try:
-                    # pandasのDataFrameから値を取得（0-indexed）
-                    cell_value = df.iloc[row, col]
-                    # NaNの場合は空文字列に変換
-                    if pd.isna(cell_value):
-                        values.append("")
-                    else:
-                        values.append(cell_value)
-                except (IndexError, KeyError):
-                    # 範囲外の場合は空文字列
-                    values.append("")
+        try:
+            # on_demand=True で対象シート以外の解析を省略する
+            book = xlrd.open_workbook(self.file_path, on_demand=True)
+            try:
+                if sheet_name:
+                    sheet = book.sheet_by_name(sheet_name)
+                else:
+                    sheet = book.sheet_by_index(0)
+
+                for i, position in enumerate(positions):
+                    if position is None:
+                        continue
+                    row, col = position
+                    if row < sheet.nrows and col < sheet.ncols:
+                        values[i] = self._convert_xls_cell(sheet.cell(row, col), book.datemode)
+            finally:
+                book.release_resources()
 
             return values
 
@@ -138,64 +288,128 @@ class CellExtractor:
                 f"エラー: Excelファイルの読み込みに失敗しました: {self.file_path} - {str(e)}"
             )
 
-    def _extract_from_csv(self, cell_list: List[str]) -> List[Any]:
-        """CSVファイルからセル値を抽出
+    def _convert_xls_cell(self, cell: xlrd.sheet.Cell, datemode: int) -> Any:
+        """xlrd のセルをPythonの値に変換
 
         Args:
-            cell_list: セル座標のリスト
+            cell: xlrd のセル
+            datemode: ブックの日付基準（0: 1900年基準、1: 1904年基準）
+
+        Returns:
+            セル値（整数値の数値は int、日付は datetime、空セル・エラー値は空文字列）
+        """
+        if cell.ctype == xlrd.XL_CELL_TEXT:
+            return cell.value
+        if cell.ctype == xlrd.XL_CELL_NUMBER:
+            # .xlsx と同じく整数値は int として扱う（例: 12.0 → 12）
+            return int(cell.value) if cell.value.is_integer() else cell.value
+        if cell.ctype == xlrd.XL_CELL_DATE:
+            return xlrd.xldate.xldate_as_datetime(cell.value, datemode)
+        if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+            return bool(cell.value)
+
+        # 空セル・空白セル・エラー値
+        return ""
+
+    def _extract_from_excel_with_pandas(self, positions: List[CellPosition], sheet_name: str = None) -> List[Any]:
+        """Excelファイルからpandasでセル値を抽出（xlrd・軽量リーダーで読めない場合）
+
+        Args:
+            positions: セル位置のリスト（不正な座標は None）
+            sheet_name: シート名（指定しない場合は最初のシート）
 
         Returns:
             抽出されたセル値のリスト
         """
         try:
-            # pandasでCSVファイルを読み込む（ヘッダーなし）
-            df = pd.read_csv(self.file_path, header=None)
-
-            values = []
-            for cell_address in cell_list:
-                row, col = self._parse_cell_address(cell_address)
-                try:
-                    # pandasのDataFrameから値を取得（0-indexed）
-                    cell_value = df.iloc[row, col]
-                    # NaNの場合は空文字列に変換
-                    if pd.isna(cell_value):
-                        values.append("")
-                    else:
-                        values.append(cell_value)
-                except (IndexError, KeyError):
-                    # 範囲外の場合は空文字列
-                    values.append("")
+            # pandasでExcelファイルを読み込む（ヘッダーなし）
+            # sheet_nameが指定されている場合はそのシートを、指定がない場合は最初のシート(0)を使用
+            sheet_param = sheet_name if sheet_name else 0
+            df = pd.read_excel(self.file_path, sheet_name=sheet_param, header=None)
 
-            return values
+            return self._gather_cells(df, positions)
 
         except Exception as e:
             raise RuntimeError(
-                f"エラー: CSVファイルの読み込みに失敗しました: {self.file_path} - {str(e)}"
+                f"エラー: Excelファイルの読み込みに失敗しました: {self.file_path} - {str(e)}"
             )
 
-    def _parse_cell_address(self, cell_address: str) -> tuple:
-        """セル座標（例: A1, B2）を行列インデックスに変換
+    def _gather_cells(self, df: pd.DataFrame, positions: List[CellPosition]) -> List[Any]:
+        """DataFrameから指定セルの値をまとめて取り出す
+
+        セルごとに df.iloc を呼び出さず、行・列インデックスの配列を作成して
+        NumPy のファンシーインデックスで一括取得する。
 
         Args:
-            cell_address: セル座標（例: "A1", "B2"）
+            df: ヘッダーなしで読み込んだDataFrame
+            positions: セル位置のリスト（不正な座標は None）
 
         Returns:
-            (row_index, col_index) のタプル（0-indexed）
+            抽出されたセル値のリスト（範囲外・NaN・不正な座標は空文字列）
         """
-        # セル座標を正規表現で分解（例: "A1" -> "A", "1"）
-        match = re.match(r'([A-Z]+)(\d+)', cell_address.upper())
-        if not match:
-            raise ValueError(f"不正なセル座標です: {cell_address}")
+        values: List[Any] = [""] * len(positions)
 
-        col_letters, row_num = match.groups()
+        # 不正なセル座標は空文字列のまま
+        targets = [
+            (i, position[0], position[1])
+            for i, position in enumerate(positions)
+            if position is not None
+        ]
+
+        if not targets:
+            return values
 
-        # 列文字を数値に変換（A=0, B=1, ..., Z=25, AA=26, ...）
-        col_index = 0
-        for char in col_letters:
-            col_index = col_index * 26 + (ord(char) - ord('A') + 1)
-        col_index -= 1  # 0-indexedに変換
+        indexes, rows, cols = (np.array(axis) for axis in zip(*targets))
 
-        # 行番号を0-indexedに変換
-        row_index = int(row_num) - 1
+        # 範囲外のセルは空文字列のままにする
+        n_rows, n_cols = df.shape
+        in_range = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
 
-        return (row_index, col_index)
+        gathered = df.to_numpy(dtype=object)[rows[in_range], cols[in_range]]
+        for i, cell_value in zip(indexes[in_range].tolist(), gathered):
+            # NaNの場合は空文字列のまま
+            if not pd.isna(cell_value):
+                values[i] = cell_value
+
+        return values
+
+    def _extract_from_csv(self, positions: List[CellPosition]) -> List[Any]:
+        """CSVファイルからセル値を抽出
+
+        pandasでファイル全体を読み込まず、標準ライブラリの csv で
+        対象セルの最大行まで読み込んだ時点で打ち切る。
+        値は型推論せず、CSVに記載された文字列のまま返す。
+
+        Args:
+            positions: セル位置のリスト（不正な座標は None）
+
+        Returns:
+            抽出されたセル値のリスト（範囲外・空欄・不正な座標は空文字列）
+        """
+        values: List[Any] = [""] * len(positions)
+
+        # 行番号ごとに (列番号, 結果の格納位置) をまとめる（不正なセル座標は空文字列のまま）
+        targets_by_row = group_positions_by_row(positions)
+
+        if not targets_by_row:
+            return values
+
+        max_row = max(targets_by_row)
+
+        try:
+            # BOM付きUTF-8にも対応するため utf-8-sig で読み込む
+            with self.file_path.open(newline='', encoding='utf-8-sig') as f:
+                for row_index, row_values in enumerate(csv.reader(f)):
+                    for col, i in targets_by_row.get(row_index, ()):
+                        if col < len(row_values):
+                            values[i] = row_values[col]
+                    # 対象セルの最大行まで読んだら以降は読まない
+                    if row_index >= max_row:
+                        break
+
+            return values
+
+        except Exception as e:
+            raise RuntimeError(
+                f"エラー: CSVファイルの読み込みに失敗しました: {self.file_path} - {str(e)}"
+            )
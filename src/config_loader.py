@@ -4,8 +4,50 @@ config.iniから設定を読み込み、プログラムで使用可能な形式
 """
 import configparser
 import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
+from src.cell_address import parse_cell_positions
+
+
+def build_label_index(cell_labels: List[str]) -> Dict[str, int]:
+    """ラベル名 → cell_values 上の位置の辞書を作成
+
+    同じラベルが複数ある場合は list.index と同様に最初の位置を使う。
+
+    Args:
+        cell_labels: ラベル名のリスト
+
+    Returns:
+        ラベル名をキー、位置を値とする辞書
+    """
+    label_index: Dict[str, int] = {}
+    for i, label in enumerate(cell_labels):
+        label_index.setdefault(label, i)
+    return label_index
+
+
+@lru_cache(maxsize=2048)
+def _match_file_type_index(pattern: re.Pattern, filename: str) -> Optional[int]:
+    """ファイル名にマッチするファイルタイプの番号を取得（結果をキャッシュ）
+
+    別ディレクトリにある同名ファイルなど、同じファイル名の判定は正規表現マッチを省略する。
+    キャッシュキーにはコンパイル済みの正規表現を含めるため、設定が異なれば別のキーになる。
+
+    Args:
+        pattern: file_pattern をまとめた正規表現（ConfigLoader._compile_file_patterns で作成）
+        filename: ファイル名（パスではなくファイル名のみ）
+
+    Returns:
+        マッチしたファイルタイプの番号。マッチしない場合はNone
+    """
+    # fnmatch.fnmatch と同様に大小文字を正規化してから照合する
+    match = pattern.match(os.path.normcase(filename))
+    if match is None:
+        return None
+    return int(match.lastgroup[1:])
 
 
 class ConfigLoader:
@@ -21,6 +63,11 @@ class ConfigLoader:
         target_sheet (str): 対象シート名（旧形式のみ）
         target_cells (List[str]): 抽出対象のセルリスト（旧形式のみ）
         image_check_cells (List[str]): 画像判定対象のセルリスト（旧形式のみ）
+        target_cell_positions (List): target_cells を (row, col) に変換したリスト（旧形式のみ）
+        image_check_cell_positions (List): image_check_cells を (row, col) に変換したリスト（旧形式のみ）
+
+    セル座標は読み込み時に1回だけ (row, col) に変換し、ファイルごとの処理で再変換しない。
+    新形式では各ファイルタイプ設定の "target_cell_positions"・"image_check_cell_positions" に格納する。
     """
 
     def __init__(self, config_path: Path):
@@ -33,11 +80,16 @@ class ConfigLoader:
             FileNotFoundError: 設定ファイルが存在しない場合
             ValueError: 必須項目が欠けている場合
         """
-        if not config_path.exists():
+        # 存在確認の stat を別に行わず、読み込み時の FileNotFoundError で判定する
+        # （ConfigParser.read は存在しないファイルを無視するため、内容を読んでから解析する）
+        try:
+            text = config_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
             raise FileNotFoundError(f"エラー: config.iniが見つかりません: {config_path}")
 
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
+        # パスやファイル名のパターンに "%" を含められるよう、値の補間（%(name)s）は行わない
+        config = configparser.RawConfigParser(interpolation=None)
+        config.read_string(text, source=str(config_path))
 
         # SETTINGS セクションの必須項目チェック
         settings_required_fields = ['target_dir', 'output_filename']
@@ -61,21 +113,25 @@ class ConfigLoader:
         if file_type_sections:
             # 新形式: 複数のファイルタイプに対応
             self.file_types = self._load_file_types(config, file_type_sections)
+            self._file_type_pattern = self._compile_file_patterns(self.file_types)
             # 旧形式の属性はNoneに設定
             self.search_keyword = None
             self.target_sheet = None
             self.target_cells = None
             self.image_check_cells = None
+            self.target_cell_positions = None
+            self.image_check_cell_positions = None
         else:
             # 旧形式: 後方互換性のため従来の動作を維持
             self._load_legacy_format(config)
             self.file_types = []
+            self._file_type_pattern = None
 
-    def _load_file_types(self, config: configparser.ConfigParser, sections: List[str]) -> List[Dict]:
+    def _load_file_types(self, config: configparser.RawConfigParser, sections: List[str]) -> List[Dict]:
         """FILE_TYPE_* セクションから各ファイルタイプの設定を読み込む
 
         Args:
-            config: ConfigParserインスタンス
+            config: RawConfigParserインスタンス
             sections: FILE_TYPE_* セクション名のリスト
 
         Returns:
@@ -116,6 +172,9 @@ class ConfigLoader:
                 # cell_labelsが指定されていない場合はセル番号を使用
                 file_type_config['cell_labels'] = file_type_config['target_cells']
 
+            # ラベル → 位置の辞書（ファイルごとに list.index で探索しないよう先に作成）
+            file_type_config['cell_label_index'] = build_label_index(file_type_config['cell_labels'])
+
             # image_check_cells はオプション（空文字列の場合は空リスト）
             image_check_cells_str = config.get(section, 'image_check_cells', fallback='')
             if image_check_cells_str.strip():
@@ -123,15 +182,42 @@ class ConfigLoader:
             else:
                 file_type_config['image_check_cells'] = []
 
+            # セル座標を (row, col) に変換しておく
+            file_type_config['target_cell_positions'] = parse_cell_positions(
+                file_type_config['target_cells']
+            )
+            file_type_config['image_check_cell_positions'] = parse_cell_positions(
+                file_type_config['image_check_cells']
+            )
+
             file_types.append(file_type_config)
 
         return file_types
 
-    def _load_legacy_format(self, config: configparser.ConfigParser):
+    def _compile_file_patterns(self, file_types: List[Dict]) -> re.Pattern:
+        """全ファイルタイプの file_pattern を1つの正規表現にまとめる
+
+        各パターンを fnmatch.translate で正規表現に変換し、名前付きグループ t{i} の
+        選択肢として連結する。選択肢は先頭から順に試されるため、複数のパターンに
+        マッチする場合も設定ファイルの記述順で最初のファイルタイプが選ばれる。
+
+        Args:
+            file_types: ファイルタイプ設定の辞書のリスト
+
+        Returns:
+            コンパイル済みの正規表現
+        """
+        alternatives = [
+            f"(?P<t{i}>{fnmatch.translate(os.path.normcase(file_type['file_pattern']))})"
+            for i, file_type in enumerate(file_types)
+        ]
+        return re.compile("|".join(alternatives))
+
+    def _load_legacy_format(self, config: configparser.RawConfigParser):
         """旧形式の設定ファイルを読み込む（後方互換性）
 
         Args:
-            config: ConfigParserインスタンス
+            config: RawConfigParserインスタンス
 
         Raises:
             ValueError: 必須項目が欠けている場合
@@ -158,6 +244,10 @@ class ConfigLoader:
             config.get('SETTINGS', 'image_check_cells')
         )
 
+        # セル座標を (row, col) に変換しておく
+        self.target_cell_positions = parse_cell_positions(self.target_cells)
+        self.image_check_cell_positions = parse_cell_positions(self.image_check_cells)
+
     def get_file_type_config(self, filename: str) -> Optional[Dict]:
         """ファイル名にマッチするファイルタイプ設定を取得
 
@@ -167,10 +257,14 @@ class ConfigLoader:
         Returns:
             マッチしたファイルタイプ設定の辞書。マッチしない場合はNone
         """
-        for file_type in self.file_types:
-            if fnmatch.fnmatch(filename, file_type['file_pattern']):
-                return file_type
-        return None
+        if self._file_type_pattern is None:
+            return None
+
+        # 全パターンを1回の正規表現マッチで判定する
+        index = _match_file_type_index(self._file_type_pattern, filename)
+        if index is None:
+            return None
+        return self.file_types[index]
 
     def _parse_cell_list(self, cell_string: str) -> List[str]:
         """カンマ区切りのセル文字列をリストにパース
@@ -2,8 +2,101 @@
 
 指定ディレクトリ配下を再帰的に探索し、条件に合致するファイルを検索する。
 """
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple, Union
+
+# 探索しないディレクトリ名（隠しディレクトリ "." 始まりも対象外）
+SKIP_DIR_NAMES = {"node_modules", "__pycache__"}
+
+# Excelが編集中に作成するロックファイルの接頭辞（"~$ファイル名.xlsx"）
+LOCK_FILE_PREFIX = "~$"
+
+# ディレクトリ走査の既定スレッド数
+DEFAULT_WALK_WORKERS = min(8, os.cpu_count() or 1)
+
+_SKIP_DIR_NAMES_BYTES = {os.fsencode(name) for name in SKIP_DIR_NAMES}
+_LOCK_FILE_PREFIX_BYTES = os.fsencode(LOCK_FILE_PREFIX)
+
+
+def _scan_dir(path: Union[str, bytes]) -> Tuple[List[os.DirEntry], List[Union[str, bytes]]]:
+    """1つのディレクトリを走査し、ファイルとサブディレクトリに振り分ける
+
+    Args:
+        path: 走査するディレクトリのパス（str または bytes）
+
+    Returns:
+        (ファイルの DirEntry のリスト, 探索対象のサブディレクトリのパスのリスト)
+    """
+    if isinstance(path, bytes):
+        hidden_prefix, lock_prefix, skip_names = b".", _LOCK_FILE_PREFIX_BYTES, _SKIP_DIR_NAMES_BYTES
+    else:
+        hidden_prefix, lock_prefix, skip_names = ".", LOCK_FILE_PREFIX, SKIP_DIR_NAMES
+
+    files = []
+    sub_dirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                # 隠し・ロックファイルの接頭辞を持つエントリはファイル・ディレクトリとも対象外
+                if name.startswith(hidden_prefix) or name.startswith(lock_prefix):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in skip_names:
+                        sub_dirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry)
+    except OSError:
+        # 読み取り権限のないディレクトリなどはスキップする
+        pass
+
+    return files, sub_dirs
+
+
+def walk_files(
+    root: Union[Path, bytes],
+    max_workers: int = DEFAULT_WALK_WORKERS
+) -> Iterator[os.DirEntry]:
+    """ディレクトリ配下のファイルを再帰的に列挙
+
+    os.scandir の DirEntry は種別情報をキャッシュしているため、
+    エントリごとに Path を生成して stat する rglob より高速に走査できる。
+    os.scandir はシステムコール中にGILを解放するため、複数スレッドで
+    ディレクトリを並行して走査し、ネットワークドライブなどの待ち時間を重ね合わせる。
+
+    以下は探索対象外とする：
+    - ディレクトリのシンボリックリンク（循環を避けるため）
+    - 隠しディレクトリ（"." 始まり）、"~$" 始まりのディレクトリと SKIP_DIR_NAMES のディレクトリ
+    - Excelのロックファイル（"~$" 始まり）
+    - 隠しファイル（"." 始まり。macOS が作成する "._ファイル名.xlsx" など）
+
+    Args:
+        root: 探索対象のルートディレクトリ（bytes を渡すとエントリ名も bytes で返る）
+        max_workers: 走査に使用するスレッド数（1の場合は逐次走査）
+
+    Yields:
+        ファイルの DirEntry（列挙順は不定）
+    """
+    root_path = os.fspath(root)
+
+    if max_workers <= 1:
+        stack = [root_path]
+        while stack:
+            files, sub_dirs = _scan_dir(stack.pop())
+            yield from files
+            stack.extend(sub_dirs)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_scan_dir, root_path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, sub_dirs = future.result()
+                pending.update(executor.submit(_scan_dir, sub_dir) for sub_dir in sub_dirs)
+                yield from files
 
 
 class FileSearcher:
@@ -48,22 +141,21 @@ class FileSearcher:
         2. 拡張子が .xlsx, .xls, .csv のいずれか
 
         Returns:
-            マッチしたファイルのPathリスト（空の場合は空リスト）
+            マッチしたファイルのPathリスト（パス順にソート済み、空の場合は空リスト）
         """
         matched_files = []
 
-        # rglob で再帰的に全ファイルを探索
-        for file_path in self.target_dir.rglob('*'):
-            # ディレクトリは除外
-            if not file_path.is_file():
-                continue
+        # bytes のまま走査し、エントリ名を str にデコードせずに照合する
+        keyword = os.fsencode(self.search_keyword)
+        extensions = tuple(os.fsencode(ext) for ext in self.SUPPORTED_EXTENSIONS)
 
-            # 拡張子チェック
-            if file_path.suffix not in self.SUPPORTED_EXTENSIONS:
-                continue
+        for entry in walk_files(os.fsencode(self.target_dir)):
+            name = entry.name
 
-            # キーワードマッチング（ファイル名に含まれるか）
-            if self.search_keyword in file_path.name:
-                matched_files.append(file_path)
+            # 拡張子チェック・キーワードマッチング（Path はマッチしたファイルのみ生成）
+            if name.endswith(extensions) and keyword in name:
+                matched_files.append(Path(os.fsdecode(entry.path)))
 
+        # 並行走査では列挙順が不定のため、実行ごとに同じ順序になるようソートする
+        matched_files.sort()
         return matched_files
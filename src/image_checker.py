@@ -2,10 +2,63 @@
 
 Excelファイルの指定セルに画像が存在するかを判定する。
 """
-import openpyxl
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from src.cell_address import CellPosition, parse_cell_positions
+from src.xlsx_reader import XlsxReader
+
+
+@lru_cache(maxsize=128)
+def _load_image_anchors(
+    path: str, mtime_ns: int, size: int
+) -> Dict[str, FrozenSet[Tuple[int, int]]]:
+    """ブック内の全シートの画像のアンカー位置を読み込む（同じファイルは再解析しない）
+
+    シートごとにZIPを開き直さないよう、1回開いたときに全シートをまとめて読み込む。
+    ファイルの更新日時・サイズもキャッシュキーに含め、更新されたファイルは読み直す。
+
+    Args:
+        path: 対象ファイルのパス
+        mtime_ns: ファイルの更新日時（ナノ秒、キャッシュキーとしてのみ使用）
+        size: ファイルサイズ（キャッシュキーとしてのみ使用）
+
+    Returns:
+        シート名 → 画像が配置されている (row_index, col_index) の集合の辞書
+        （ブック内のシート順）
+    """
+    with XlsxReader(Path(path)) as reader:
+        return {
+            name: frozenset(anchors)
+            for name, anchors in reader.read_all_image_anchors().items()
+        }
+
+
+def check_images(
+    file_path: Path,
+    cell_list: List[str],
+    sheet_name: str = None,
+    positions: Optional[List[CellPosition]] = None,
+    reader: Optional[XlsxReader] = None
+) -> List[str]:
+    """探索済みファイルの指定セルに画像が存在するかを判定
+
+    FileSearcher などで存在を確認済みのファイルを対象とし、
+    ImageChecker の初期化時の確認を省略する。
+
+    Args:
+        file_path: 対象ファイルのパス
+        cell_list: セル座標のリスト（例: ["D1", "E1"]）
+        sheet_name: シート名（Excelファイルのみ有効、指定しない場合は最初のシート）
+        positions: cell_list を変換済みのセル位置のリスト（省略時はここで変換）
+        reader: 開いている軽量リーダー（.xlsxのみ有効、クローズは呼び出し元が行う）
+
+    Returns:
+        判定結果のリスト（"○": 画像あり、"×": 画像なし、"-": 画像判定非対応）
+    """
+    checker = ImageChecker(file_path, validate=False, reader=reader)
+    return checker.check_images(cell_list, sheet_name, positions=positions)
 
 
 class ImageChecker:
@@ -14,34 +67,55 @@ class ImageChecker:
     Attributes:
         file_path (Path): 対象ファイルのパス
         file_extension (str): ファイルの拡張子
+        reader (Optional[XlsxReader]): 呼び出し元で開いている軽量リーダー（共有用）
     """
 
     # 画像判定をサポートする拡張子（.xlsxのみ）
-    SUPPORTED_EXTENSIONS = {'.xlsx'}
-
-    def __init__(self, file_path: Path):
+    SUPPORTED_EXTENSIONS = frozenset({'.xlsx'})
+
+    def __init__(
+        self,
+        file_path: Path,
+        validate: bool = True,
+        reader: Optional[XlsxReader] = None
+    ):
         """画像判定の初期化
 
         Args:
             file_path: 対象ファイルのパス
+            validate: ファイルの存在を確認するか
+                （探索時に確認済みのファイルではFalseにして stat を省略できる）
+            reader: 開いている軽量リーダー（.xlsxのみ有効）。
+                指定した場合はZIPを開き直さずに使用し、クローズは呼び出し元が行う
 
         Raises:
             FileNotFoundError: ファイルが存在しない場合
         """
-        if not file_path.exists():
+        # Path.exists より軽い os.path.exists で存在を確認する
+        if validate and not os.path.exists(file_path):
             raise FileNotFoundError(
                 f"エラー: ファイルが見つかりません: {file_path}"
             )
 
         self.file_path = file_path
         self.file_extension = file_path.suffix.lower()
+        self.reader = reader
 
-    def check_images(self, cell_list: List[str], sheet_name: str = None) -> List[str]:
+        # シートごとの画像のアンカー位置（同じインスタンスでの2回目以降の判定で再利用する）
+        self._sheet_anchors: Dict[Optional[str], FrozenSet[Tuple[int, int]]] = {}
+
+    def check_images(
+        self,
+        cell_list: List[str],
+        sheet_name: str = None,
+        positions: Optional[List[CellPosition]] = None
+    ) -> List[str]:
         """指定されたセルに画像が存在するかを判定
 
         Args:
             cell_list: セル座標のリスト（例: ["D1", "E1"]）
             sheet_name: シート名（Excelファイルのみ有効、指定しない場合は最初のシート）
+            positions: cell_list を変換済みのセル位置のリスト（省略時はここで変換）
 
         Returns:
             判定結果のリスト
@@ -53,105 +127,65 @@ class ImageChecker:
         if not cell_list:
             return []
 
-        # .xlsx形式以外は画像判定非対応
+        # .xlsx形式以外は画像判定非対応（ファイルを開かずに拡張子だけで判定する）
         if self.file_extension not in self.SUPPORTED_EXTENSIONS:
             return ["-"] * len(cell_list)
 
-        return self._check_images_in_excel(cell_list, sheet_name)
+        if positions is None:
+            positions = parse_cell_positions(cell_list)
+
+        return self._check_images_in_excel(positions, sheet_name)
 
-    def _check_images_in_excel(self, cell_list: List[str], sheet_name: str = None) -> List[str]:
+    def _check_images_in_excel(self, positions: List[CellPosition], sheet_name: str = None) -> List[str]:
         """Excelファイル内の画像を判定
 
         Args:
-            cell_list: セル座標のリスト
+            positions: セル位置のリスト（不正な座標は None）
             sheet_name: シート名（指定しない場合は最初のシート）
 
         Returns:
             判定結果のリスト（"○" or "×"）
         """
         try:
-            # openpyxlでExcelファイルを開く
-            workbook = openpyxl.load_workbook(self.file_path)
-
-            # シート名が指定されている場合はそのシートを、指定がない場合は最初のシートを使用
-            if sheet_name:
-                sheet = workbook[sheet_name]
-            else:
-                sheet = workbook.worksheets[0]
-
-            # シート内の全画像を取得
-            images = sheet._images
+            # 描画パーツのみを直接読み込む（openpyxl の通常モードのようにブック全体を読み込まない）
+            anchors = self._get_sheet_anchors(sheet_name or None)
 
             # 各セルについて画像の有無を判定
-            results = []
-            for cell_address in cell_list:
-                has_image = self._has_image_at_cell(images, cell_address)
-                results.append("○" if has_image else "×")
-
-            workbook.close()
-            return results
+            # 不正なセル座標（None）は集合に含まれないため"×"になる
+            return [
+                "○" if position in anchors else "×"
+                for position in positions
+            ]
 
         except Exception as e:
             # エラーが発生した場合は全て"×"を返す
-            return ["×"] * len(cell_list)
+            return ["×"] * len(positions)
 
-    def _has_image_at_cell(self, images, cell_address: str) -> bool:
-        """指定セルに画像が存在するかをチェック
+    def _get_sheet_anchors(self, sheet_name: Optional[str]) -> FrozenSet[Tuple[int, int]]:
+        """シートの画像のアンカー位置を取得（インスタンス内で1回だけ stat・キャッシュ参照する）
 
         Args:
-            images: シート内の画像リスト
-            cell_address: セル座標（例: "D1"）
+            sheet_name: シート名（Noneの場合は最初のシート）
 
         Returns:
-            画像が存在する場合True、存在しない場合False
+            画像が配置されている (row_index, col_index) の集合（0-indexed）
         """
-        # 画像がない場合はFalse
-        if not images:
-            return False
-
-        # セル座標を行列番号に変換
-        row, col = self._parse_cell_address(cell_address)
-
-        # 各画像のアンカーポイントをチェック
-        for image in images:
-            # 画像のアンカー位置を取得
-            anchor = image.anchor
-
-            # アンカーがOneCellAnchorまたはTwoCellAnchorの場合
-            if hasattr(anchor, '_from'):
-                # アンカーの開始セル位置を取得
-                anchor_col = anchor._from.col
-                anchor_row = anchor._from.row
-
-                # セル位置が一致するかチェック
-                if anchor_col == col and anchor_row == row:
-                    return True
-
-        return False
-
-    def _parse_cell_address(self, cell_address: str) -> tuple:
-        """セル座標（例: A1, B2）を行列インデックスに変換
-
-        Args:
-            cell_address: セル座標（例: "A1", "B2"）
-
-        Returns:
-            (row_index, col_index) のタプル（0-indexed）
-        """
-        # セル座標を正規表現で分解（例: "A1" -> "A", "1"）
-        match = re.match(r'([A-Z]+)(\d+)', cell_address.upper())
-        if not match:
-            raise ValueError(f"不正なセル座標です: {cell_address}")
-
-        col_letters, row_num = match.groups()
-
-        # 列文字を数値に変換（A=0, B=1, ..., Z=25, AA=26, ...）
-        col_index = 0
-        for char in col_letters:
-            col_index = col_index * 26 + (ord(char) - ord('A') + 1)
-        col_index -= 1  # 0-indexedに変換
-
-        # 行番号を0-indexedに変換
-        row_index = int(row_num) - 1
-
-        return (row_index, col_index)
+        anchors = self._sheet_anchors.get(sheet_name)
+        if anchors is None and self.reader is not None:
+            # 共有リーダーがある場合は開いているZIPから直接読み込む
+            anchors = frozenset(self.reader.read_image_anchors(sheet_name))
+            self._sheet_anchors[sheet_name] = anchors
+        elif anchors is None:
+            stat = os.stat(self.file_path)
+            workbook_anchors = _load_image_anchors(
+                os.fspath(self.file_path), stat.st_mtime_ns, stat.st_size
+            )
+            if sheet_name is None:
+                # シート名の指定がない場合は最初のシート
+                if not workbook_anchors:
+                    raise KeyError("ワークシートが存在しません")
+                anchors = next(iter(workbook_anchors.values()))
+            else:
+                anchors = workbook_anchors[sheet_name]
+            self._sheet_anchors[sheet_name] = anchors
+        return anchors
@@ -4,14 +4,256 @@ Excelファイルチェッカーのメイン実行プログラム。
 設定ファイルを読み込み、ファイル探索、セル値抽出、画像判定、結果出力を統合的に実行する。
 """
 import argparse
+import csv
+import io
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Callable, TextIO
+from src.cell_address import CellPosition
 from src.config_loader import ConfigLoader
-from src.file_searcher import FileSearcher
-from src.cell_extractor import CellExtractor
-from src.image_checker import ImageChecker
+from src.file_searcher import FileSearcher, walk_files
+from src.cell_extractor import extract_cells
+from src.image_checker import check_images
 from src.output_formatter import OutputFormatter
-from src.review_validator import ReviewValidator
+from src.review_validator import ReviewValidator, get_label_index
+from src.result_cache import ResultCache
+from src.xlsx_reader import XlsxReader
+from src.batch_reader import BatchReader
+
+
+class _BufferedStdoutHandler(logging.Handler):
+    """ログをまとめて標準出力に書き込むハンドラ
+
+    1行ごとに標準出力へ書き込む（システムコールを発行する）代わりに、
+    capacity 件たまるか flush が呼ばれた時点でまとめて書き込む。
+    書き込み先は flush 時点の sys.stdout を参照する（差し替えられた出力先にも対応）。
+
+    Attributes:
+        capacity (int): まとめて書き込むまでに保持するログの件数
+    """
+
+    def __init__(self, capacity: int = 256):
+        """ハンドラの初期化
+
+        Args:
+            capacity: まとめて書き込むまでに保持するログの件数
+        """
+        super().__init__()
+        self.capacity = capacity
+        self._lines: List[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        """ログをバッファに追加し、上限に達した場合は書き込む"""
+        self._lines.append(self.format(record))
+        if len(self._lines) >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        """バッファ内のログを標準出力に書き込む"""
+        self.acquire()
+        try:
+            if self._lines:
+                stream = sys.stdout
+                stream.write("\n".join(self._lines) + "\n")
+                stream.flush()
+                self._lines.clear()
+        finally:
+            self.release()
+
+
+_log_handler = _BufferedStdoutHandler()
+_log_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(_log_handler)
+# 従来どおり標準出力のみに出力する（ルートロガーの設定には依存しない）
+logger.propagate = False
+
+
+def _extract_file(
+    file_path: Path,
+    target_cells: List[str],
+    image_check_cells: List[str],
+    sheet_name: Optional[str],
+    target_positions: Optional[List[CellPosition]] = None,
+    image_positions: Optional[List[CellPosition]] = None
+) -> Tuple[List[Any], List[str]]:
+    """単一ファイルのセル値抽出と画像判定を実行
+
+    Args:
+        file_path: 処理対象ファイルのパス
+        target_cells: 抽出対象セルのリスト
+        image_check_cells: 画像判定対象セルのリスト
+        sheet_name: シート名（Noneの場合は最初のシート）
+        target_positions: target_cells を変換済みのセル位置のリスト（省略時は都度変換）
+        image_positions: image_check_cells を変換済みのセル位置のリスト（省略時は都度変換）
+
+    Returns:
+        (セル値のリスト, 画像判定結果のリスト) のタプル
+    """
+    # セル値・画像ともに.xlsxは軽量リーダーで必要なパーツのみ読み込む。
+    # 両方が必要な場合はZIPを1回だけ開き、ブック構成の解析もセル値抽出と画像判定で共有する
+    reader = None
+    if target_cells and image_check_cells and file_path.suffix.lower() == ".xlsx":
+        try:
+            reader = XlsxReader(file_path)
+        except Exception:
+            # 開けない場合は共有せず、それぞれの方法で読み込む
+            reader = None
+
+    try:
+        # 探索時にファイルの存在・拡張子は確認済みのため、初期化時の確認は省略する
+        cell_values = extract_cells(
+            file_path, target_cells, sheet_name=sheet_name,
+            positions=target_positions, reader=reader
+        )
+        image_results = check_images(
+            file_path, image_check_cells, sheet_name=sheet_name,
+            positions=image_positions, reader=reader
+        )
+    finally:
+        if reader is not None:
+            reader.close()
+
+    return cell_values, image_results
+
+
+def _process_file(
+    file_path: Path,
+    target_cells: List[str],
+    image_check_cells: List[str],
+    sheet_name: Optional[str],
+    target_positions: Optional[List[CellPosition]] = None,
+    image_positions: Optional[List[CellPosition]] = None
+) -> Dict[str, Any]:
+    """単一ファイルを処理（旧形式用）
+
+    Args:
+        file_path: 処理対象ファイルのパス
+        target_cells: 抽出対象セルのリスト
+        image_check_cells: 画像判定対象セルのリスト
+        sheet_name: シート名（Noneの場合は最初のシート）
+        target_positions: target_cells を変換済みのセル位置のリスト（省略時は都度変換）
+        image_positions: image_check_cells を変換済みのセル位置のリスト（省略時は都度変換）
+
+    Returns:
+        処理結果の辞書
+        形式: {"filename": str, "cell_values": List[Any], "image_results": List[str]}
+    """
+    cell_values, image_results = _extract_file(
+        file_path, target_cells, image_check_cells, sheet_name,
+        target_positions, image_positions
+    )
+
+    return {
+        "filename": str(file_path.name),
+        "cell_values": cell_values,
+        "image_results": image_results
+    }
+
+
+def _process_file_worker(
+    file_path: Path,
+    target_cells: List[str],
+    image_check_cells: List[str],
+    sheet_name: Optional[str],
+    target_positions: Optional[List[CellPosition]] = None,
+    image_positions: Optional[List[CellPosition]] = None
+) -> Tuple[bool, Any]:
+    """ProcessPoolExecutor から呼び出すワーカー関数（旧形式用）
+
+    プロセス間で受け渡せるようモジュールレベルに定義し、
+    例外は送出せずに (成功したか, 結果またはエラーメッセージ) を返す。
+
+    Args:
+        file_path: 処理対象ファイルのパス
+        target_cells: 抽出対象セルのリスト
+        image_check_cells: 画像判定対象セルのリスト
+        sheet_name: シート名（Noneの場合は最初のシート）
+        target_positions: target_cells を変換済みのセル位置のリスト（省略時は都度変換）
+        image_positions: image_check_cells を変換済みのセル位置のリスト（省略時は都度変換）
+
+    Returns:
+        (True, 処理結果の辞書) または (False, エラーメッセージ)
+    """
+    try:
+        return True, _process_file(
+            file_path, target_cells, image_check_cells, sheet_name,
+            target_positions, image_positions
+        )
+    except Exception as e:
+        return False, str(e)
+
+
+def _process_file_with_config(file_path: Path, file_type_config: Dict) -> Dict[str, Any]:
+    """単一ファイルを指定された設定で処理（新形式用）
+
+    Args:
+        file_path: 処理対象ファイルのパス
+        file_type_config: ファイルタイプ設定の辞書
+
+    Returns:
+        処理結果の辞書
+        形式: {"filename": str, "cell_values": List[Any], "image_results": List[str],
+               "target_cells": List[str], "image_check_cells": List[str], "cell_labels": List[str],
+               "cell_label_index": Dict[str, int]}
+    """
+    cell_values, image_results = _extract_file(
+        file_path,
+        file_type_config['target_cells'],
+        file_type_config['image_check_cells'],
+        file_type_config['target_sheet'],
+        file_type_config['target_cell_positions'],
+        file_type_config['image_check_cell_positions']
+    )
+
+    return {
+        "filename": str(file_path.name),
+        "cell_values": cell_values,
+        "image_results": image_results,
+        "target_cells": file_type_config['target_cells'],
+        "image_check_cells": file_type_config['image_check_cells'],
+        "cell_labels": file_type_config['cell_labels'],
+        "cell_label_index": file_type_config['cell_label_index']
+    }
+
+
+def _process_file_with_config_worker(file_path: Path, file_type_config: Dict) -> Tuple[bool, Any]:
+    """ProcessPoolExecutor から呼び出すワーカー関数（新形式用）
+
+    Args:
+        file_path: 処理対象ファイルのパス
+        file_type_config: ファイルタイプ設定の辞書
+
+    Returns:
+        (True, 処理結果の辞書) または (False, エラーメッセージ)
+    """
+    try:
+        return True, _process_file_with_config(file_path, file_type_config)
+    except Exception as e:
+        return False, str(e)
+
+
+def _process_file_group_worker(file_paths: List[Path], file_type_config: Dict) -> List[Tuple[bool, Any]]:
+    """同じファイルタイプの複数ファイルを処理するワーカー関数（新形式用）
+
+    ファイルタイプ設定はファイルごとではなくグループごとに1回だけワーカーへ送られる。
+
+    Args:
+        file_paths: 同じファイルタイプに属するファイルのパスリスト
+        file_type_config: ファイルタイプ設定の辞書
+
+    Returns:
+        file_paths と同じ順序の (成功したか, 処理結果の辞書またはエラーメッセージ) のリスト
+    """
+    return [_process_file_with_config_worker(file_path, file_type_config) for file_path in file_paths]
 
 
 class ExcelFileChecker:
@@ -23,13 +265,46 @@ class ExcelFileChecker:
     Attributes:
         config_path (Path): 設定ファイルのパス
         config (ConfigLoader): 設定ローダー
+        target_dir (Path): 探索対象のルートディレクトリ
+        cache (Optional[ResultCache]): 抽出結果のキャッシュ（無効の場合はNone）
+        max_workers (int): ファイル処理の並列数
+        batch_size (int): 出力ファイルへ書き出す（flushする）行数の単位
     """
 
-    def __init__(self, config_path: Path):
+    # キャッシュディレクトリ名（設定ファイルと同じディレクトリに作成）
+    CACHE_DIR_NAME = ".cache"
+
+    # 出力ファイルへ書き出す行数の既定値
+    DEFAULT_BATCH_SIZE = 100
+
+    # 出力ファイルの書き込みバッファサイズ（バイト）
+    OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+    # 新形式でファイルタイプごとにまとめて1タスクとして処理するファイル数の上限
+    MAX_GROUP_TASK_SIZE = 16
+
+    # ファイル名からファイルタイプを判定する正規表現
+    # チェックリストの判定を記録表より優先するため、先読みでファイル名全体を順に調べる
+    _FILE_TYPE_PATTERN = re.compile(
+        r"(?=.*(?:レビューチェックリスト|checklist))(?P<checklist>)"
+        r"|(?=.*記録表)(?P<record>)",
+        re.IGNORECASE | re.DOTALL
+    )
+
+    def __init__(
+        self,
+        config_path: Path,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
         """メインプログラムの初期化
 
         Args:
             config_path: 設定ファイル（config.ini）のパス
+            use_cache: 抽出結果のキャッシュを使用するか
+            max_workers: ファイル処理の並列数（省略時はCPUコア数、1の場合は逐次処理）
+            batch_size: 出力ファイルへ書き出す行数の単位（省略時は DEFAULT_BATCH_SIZE）
 
         Raises:
             FileNotFoundError: 設定ファイルが存在しない場合
@@ -41,6 +316,28 @@ class ExcelFileChecker:
 
         self.config_path = config_path
         self.config = ConfigLoader(config_path)
+        self.target_dir = Path(self.config.target_dir)
+        self.cache = ResultCache(config_path.parent / self.CACHE_DIR_NAME) if use_cache else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        # 並列処理用のプロセスプール（最初に必要になった時点で起動する）
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # with 文で使用した場合のみ、プロセスプールを run をまたいで再利用する
+        self._reuse_executor = False
+
+    def __enter__(self):
+        self._reuse_executor = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._reuse_executor = False
+        self.close()
+
+    def close(self):
+        """プロセスプールを停止"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def run(self):
         """メイン処理を実行
@@ -50,52 +347,67 @@ class ExcelFileChecker:
         2. 各ファイルのセル値抽出
         3. 各ファイルの画像判定
         4. 結果の整形と出力
+
+        with 文の外で呼び出した場合は、終了時にプロセスプールを停止する。
         """
+        try:
+            self._run()
+        finally:
+            # 再利用しないプロセスプールはワーカープロセスを残さないよう停止する
+            if not self._reuse_executor:
+                self.close()
+            # 処理途中で例外が発生した場合もログを出力しきる
+            _log_handler.flush()
+
+    def _run(self):
+        """メイン処理の本体（ログは run でまとめて出力する）"""
         self._log_info(f"探索開始: {self.config.target_dir}")
 
         # 新形式（複数ファイルタイプ）と旧形式で処理を分岐
         if self.config.file_types:
-            # 新形式: 全ての.xlsxファイルを探索し、各ファイルタイプの設定を適用
-            all_files = self._search_all_excel_files()
+            # 新形式: 全ての.xlsxファイルを探索し、ファイル名にマッチする設定を適用
+            target_files, target_configs = self._search_target_files()
+
             matched_files = []
-            results = []
             validator = ReviewValidator()
 
-            for file_path in all_files:
-                # ファイル名にマッチする設定を取得
-                file_type_config = self.config.get_file_type_config(file_path.name)
+            outcomes = self._process_files_with_config(target_files, target_configs)
+            for file_path, (ok, payload) in zip(target_files, outcomes):
+                if not ok:
+                    self._log_error(f"ファイル処理失敗: {file_path.name} - {payload}")
+                    continue
 
-                if file_type_config:
-                    try:
-                        result = self._process_file_with_config(file_path, file_type_config)
-                        result["file_path"] = file_path
-                        results.append(result)
-                        matched_files.append(file_path)
+                result = payload
+                result["file_path"] = file_path
+                matched_files.append(file_path)
 
-                        # ファイルタイプを判定してバリデーターに追加
-                        file_type = self._determine_file_type(file_path.name)
-                        if file_type:
-                            validator.add_file(result, file_type)
+                # ファイルタイプを判定してバリデーターに追加
+                filename = result["filename"]
+                file_type = self._determine_file_type(filename)
+                if file_type:
+                    validator.add_file(result, file_type)
 
-                        self._log_info(f"処理: {file_path.name}")
-                    except Exception as e:
-                        self._log_error(f"ファイル処理失敗: {file_path.name} - {str(e)}")
-                        continue
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._log_debug(f"処理: {filename}")
 
             self._log_info(f"発見: {len(matched_files)}件のファイル")
 
             # ペアリングと検証を実行
             validation_results = validator.validate_all()
 
-            # 結果を整形（新形式用・検証結果付き）
-            formatted_output = self._format_validation_results(
-                validation_results,
-                root_dir=Path(self.config.target_dir)
+            # 結果を整形しながらファイルに書き込む（新形式用・検証結果付き）
+            self._write_output(
+                lambda stream: self._write_validation_results(
+                    stream,
+                    validation_results,
+                    root_dir=self.target_dir
+                )
             )
+            processed_count = len(matched_files)
         else:
             # 旧形式: search_keywordでファイルを探索
             searcher = FileSearcher(
-                target_dir=Path(self.config.target_dir),
+                target_dir=self.target_dir,
                 search_keyword=self.config.search_keyword
             )
             matched_files = searcher.search()
@@ -104,111 +416,248 @@ class ExcelFileChecker:
 
             # 各ファイルを処理
             results = []
-            for file_path in matched_files:
-                try:
-                    result = self._process_file(file_path)
-                    results.append(result)
-                    self._log_info(f"処理: {file_path.name}")
-                except Exception as e:
-                    self._log_error(f"ファイル処理失敗: {file_path.name} - {str(e)}")
-                    continue
-
-            # 結果を整形（旧形式用）
+            for file_path, (ok, payload) in zip(matched_files, self._process_files(matched_files)):
+                if ok:
+                    results.append(payload)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        self._log_debug(f"処理: {file_path.name}")
+                else:
+                    self._log_error(f"ファイル処理失敗: {file_path.name} - {payload}")
+
+            # 結果を整形しながらファイルに書き込む（旧形式用）
             formatter = OutputFormatter(
                 target_cells=self.config.target_cells,
                 image_check_cells=self.config.image_check_cells
             )
-            formatted_output = formatter.format_results(
-                results,
-                root_dir=Path(self.config.target_dir),
-                file_paths=matched_files
+            self._write_output(
+                lambda stream: formatter.write_results(
+                    stream,
+                    results,
+                    root_dir=self.target_dir,
+                    file_paths=matched_files,
+                    batch_size=self.batch_size
+                )
             )
+            processed_count = len(results)
+
+        self._log_info(f"処理完了: {processed_count}ファイル処理")
 
-        # 結果をファイルに保存
-        self._save_results(formatted_output)
+        # 長期間参照されていないキャッシュ（削除・移動したファイルの分など）を削除する
+        if self.cache:
+            self.cache.prune()
 
-        self._log_info(f"処理完了: {len(results)}ファイル処理")
+    def _search_target_files(self) -> Tuple[List[Path], List[Dict]]:
+        """対象ディレクトリ配下の.xlsxファイルから、ファイルタイプ設定にマッチするものを探索
 
-    def _search_all_excel_files(self) -> List[Path]:
-        """対象ディレクトリ配下の全てのExcelファイルを探索
+        ファイル名（DirEntry.name の文字列）だけで拡張子と設定を照合し、
+        Path はマッチしたファイルのみ生成する。
 
         Returns:
-            見つかったExcelファイルのパスリスト
+            (ファイルのパスリスト, 各ファイルにマッチしたファイルタイプ設定のリスト) のタプル
+            （パス順にソート済み）
         """
-        target_dir = Path(self.config.target_dir)
-        excel_files = []
+        get_file_type_config = self.config.get_file_type_config
+        matches = []
+        for entry in walk_files(self.target_dir):
+            name = entry.name
+            if not name.endswith(".xlsx"):
+                continue
+            file_type_config = get_file_type_config(name)
+            if file_type_config:
+                matches.append((Path(entry.path), file_type_config))
+
+        # 並行走査では列挙順が不定のため、実行ごとに同じ順序になるようソートする
+        matches.sort(key=lambda match: match[0])
+        return [path for path, _ in matches], [config for _, config in matches]
+
+    def _process_files(self, file_paths: List[Path]) -> List[Tuple[bool, Any]]:
+        """複数ファイルを処理（旧形式用）
+
+        キャッシュにないファイルのみを対象に、複数ファイルがある場合は
+        ProcessPoolExecutor で並列に処理する。結果は file_paths と同じ順序で返す。
 
-        # .xlsxファイルを再帰的に探索
-        for file_path in target_dir.rglob("*.xlsx"):
-            if file_path.is_file():
-                excel_files.append(file_path)
+        Args:
+            file_paths: 処理対象ファイルのパスリスト
 
-        return excel_files
+        Returns:
+            (成功したか, 処理結果の辞書またはエラーメッセージ) のタプルのリスト
+        """
+        # 抽出設定が変わった場合はキャッシュを使わないよう、設定値をキーに含める
+        signature = repr((
+            self.config.target_sheet,
+            self.config.target_cells,
+            self.config.image_check_cells
+        ))
+
+        # ワーカーには必要な設定値のみを渡し、プロセス間通信を最小限にする
+        worker = partial(
+            _process_file_worker,
+            target_cells=self.config.target_cells,
+            image_check_cells=self.config.image_check_cells,
+            sheet_name=self.config.target_sheet,
+            target_positions=self.config.target_cell_positions,
+            image_positions=self.config.image_check_cell_positions
+        )
+        return self._map_files_with_cache(
+            partial(self._map_files, worker), file_paths, [signature] * len(file_paths)
+        )
 
-    def _process_file(self, file_path: Path) -> Dict[str, Any]:
-        """単一ファイルを処理（旧形式用）
+    def _process_files_with_config(
+        self,
+        file_paths: List[Path],
+        file_type_configs: List[Dict]
+    ) -> List[Tuple[bool, Any]]:
+        """複数ファイルをそれぞれのファイルタイプ設定で処理（新形式用）
+
+        複数ファイルがある場合は ProcessPoolExecutor で並列に処理する。
+        結果は file_paths と同じ順序で返す。
 
         Args:
-            file_path: 処理対象ファイルのパス
+            file_paths: 処理対象ファイルのパスリスト
+            file_type_configs: 各ファイルに対応するファイルタイプ設定のリスト
 
         Returns:
-            処理結果の辞書
-            形式: {"filename": str, "cell_values": List[Any], "image_results": List[str]}
+            (成功したか, 処理結果の辞書またはエラーメッセージ) のタプルのリスト
         """
-        # セル値を抽出（シート名を指定）
-        extractor = CellExtractor(file_path)
-        cell_values = extractor.extract_cells(
-            self.config.target_cells,
-            sheet_name=self.config.target_sheet
+        # 抽出設定が変わった場合はキャッシュを使わないよう、ファイルタイプの設定値をキーに含める
+        signatures = [
+            repr((
+                file_type_config['target_sheet'],
+                file_type_config['target_cells'],
+                file_type_config['image_check_cells'],
+                file_type_config['cell_labels']
+            ))
+            for file_type_config in file_type_configs
+        ]
+        return self._map_files_with_cache(
+            self._map_file_groups, file_paths, signatures, file_type_configs
         )
 
-        # 画像判定を実行（シート名を指定）
-        checker = ImageChecker(file_path)
-        image_results = checker.check_images(
-            self.config.image_check_cells,
-            sheet_name=self.config.target_sheet
-        )
+    def _map_files_with_cache(
+        self,
+        map_pending: Callable[..., List[Tuple[bool, Any]]],
+        file_paths: List[Path],
+        signatures: List[str],
+        *arg_lists: List[Any]
+    ) -> List[Tuple[bool, Any]]:
+        """キャッシュにないファイルのみにワーカー関数を適用
 
-        return {
-            "filename": str(file_path.name),
-            "cell_values": cell_values,
-            "image_results": image_results
-        }
+        キャッシュ済みのファイルは読み込まずに前回の結果を使い、
+        新たに処理に成功したファイルの結果はキャッシュに保存する。
 
-    def _process_file_with_config(self, file_path: Path, file_type_config: Dict) -> Dict[str, Any]:
-        """単一ファイルを指定された設定で処理（新形式用）
+        Args:
+            map_pending: キャッシュにないファイルのパスリスト（と arg_lists の対応する要素）を受け取り、
+                同じ順序の処理結果のリストを返す関数（_map_files・_map_file_groups）
+            file_paths: 処理対象ファイルのパスリスト
+            signatures: 各ファイルの抽出設定を表す文字列のリスト（キャッシュキーに使用）
+            arg_lists: ファイルごとにワーカーへ渡す追加引数のリスト（file_paths と同じ長さ）
+
+        Returns:
+            file_paths と同じ順序の処理結果のリスト
+        """
+        outcomes: List[Optional[Tuple[bool, Any]]] = [None] * len(file_paths)
+        pending = []
+        for i, file_path in enumerate(file_paths):
+            cached = self.cache.get(file_path, signatures[i]) if self.cache else None
+            if cached is not None:
+                outcomes[i] = (True, cached)
+            else:
+                pending.append(i)
+
+        pending_paths = [file_paths[i] for i in pending]
+        pending_args = [[arg_list[i] for i in pending] for arg_list in arg_lists]
+        for i, outcome in zip(pending, map_pending(pending_paths, *pending_args)):
+            outcomes[i] = outcome
+            ok, payload = outcome
+            if ok and self.cache:
+                self.cache.put(file_paths[i], signatures[i], payload)
+
+        return outcomes
+
+    def _map_files(self, worker, file_paths: List[Path], *arg_lists: List[Any]) -> List[Tuple[bool, Any]]:
+        """ワーカー関数を各ファイルに適用（可能な場合は並列実行）
 
         Args:
-            file_path: 処理対象ファイルのパス
-            file_type_config: ファイルタイプ設定の辞書
+            worker: ファイルパス（と arg_lists の対応する要素）を受け取り
+                (成功したか, 結果) を返すモジュールレベル関数
+            file_paths: 処理対象ファイルのパスリスト
+            arg_lists: ファイルごとにワーカーへ渡す追加引数のリスト（file_paths と同じ長さ）
 
         Returns:
-            処理結果の辞書
-            形式: {"filename": str, "cell_values": List[Any], "image_results": List[str],
-                   "target_cells": List[str], "image_check_cells": List[str]}
+            file_paths と同じ順序の処理結果のリスト
         """
-        # セル値を抽出
-        extractor = CellExtractor(file_path)
-        cell_values = extractor.extract_cells(
-            file_type_config['target_cells'],
-            sheet_name=file_type_config['target_sheet']
-        )
+        with BatchReader() as reader:
+            # 全ファイルの読み込みを先にまとめて依頼し、ディスク待ちを処理と重ね合わせる
+            reader.prefetch(file_paths)
+            return self._map_tasks(worker, file_paths, *arg_lists, chunksize=4)
 
-        # 画像判定を実行
-        checker = ImageChecker(file_path)
-        image_results = checker.check_images(
-            file_type_config['image_check_cells'],
-            sheet_name=file_type_config['target_sheet']
-        )
+    def _map_file_groups(self, file_paths: List[Path], file_type_configs: List[Dict]) -> List[Tuple[bool, Any]]:
+        """ファイルをファイルタイプごとにまとめて処理（新形式用）
 
-        return {
-            "filename": str(file_path.name),
-            "cell_values": cell_values,
-            "image_results": image_results,
-            "target_cells": file_type_config['target_cells'],
-            "image_check_cells": file_type_config['image_check_cells'],
-            "cell_labels": file_type_config['cell_labels']
-        }
+        同じファイルタイプ設定のファイルをグループにまとめ、グループを分割した
+        タスク単位でワーカーに渡す。設定の辞書はファイルごとではなくタスクごとに
+        1回だけプロセス間で送られる。
+
+        Args:
+            file_paths: 処理対象ファイルのパスリスト
+            file_type_configs: 各ファイルに対応するファイルタイプ設定のリスト
+
+        Returns:
+            file_paths と同じ順序の処理結果のリスト
+        """
+        # ファイルタイプ設定（ConfigLoader が返す同一の辞書）ごとにファイルの位置をまとめる
+        groups: Dict[int, Tuple[Dict, List[int]]] = {}
+        for i, file_type_config in enumerate(file_type_configs):
+            groups.setdefault(id(file_type_config), (file_type_config, []))[1].append(i)
+
+        # 並列数の数倍のタスクに分かれるよう、1タスクあたりのファイル数を決める
+        task_size = max(1, min(
+            self.MAX_GROUP_TASK_SIZE,
+            len(file_paths) // (self.max_workers * 4)
+        ))
+        task_indexes: List[List[int]] = []
+        task_configs: List[Dict] = []
+        for file_type_config, indexes in groups.values():
+            for start in range(0, len(indexes), task_size):
+                task_indexes.append(indexes[start:start + task_size])
+                task_configs.append(file_type_config)
+
+        task_paths = [[file_paths[i] for i in indexes] for indexes in task_indexes]
+
+        outcomes: List[Optional[Tuple[bool, Any]]] = [None] * len(file_paths)
+        with BatchReader() as reader:
+            reader.prefetch(file_paths)
+            task_outcomes = self._map_tasks(_process_file_group_worker, task_paths, task_configs)
+        for indexes, group_outcomes in zip(task_indexes, task_outcomes):
+            for i, outcome in zip(indexes, group_outcomes):
+                outcomes[i] = outcome
+        return outcomes
+
+    def _map_tasks(self, worker, *arg_lists: List[Any], chunksize: int = 1) -> List[Any]:
+        """ワーカー関数を各タスクに適用（可能な場合はプロセスプールで並列実行）
+
+        Args:
+            worker: arg_lists の対応する要素を受け取るモジュールレベル関数
+            arg_lists: タスクごとにワーカーへ渡す引数のリスト（全て同じ長さ）
+            chunksize: プロセス間で1回に送るタスク数
+
+        Returns:
+            タスクと同じ順序のワーカーの戻り値のリスト
+        """
+        # タスクが1件以下、または並列数1の場合はプロセス起動コストの方が大きいため逐次処理
+        if len(arg_lists[0]) <= 1 or self.max_workers <= 1:
+            return list(map(worker, *arg_lists))
+
+        try:
+            # with 文で使用している間は、プロセスの起動コストは初回の run のみ発生する
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return list(self._executor.map(worker, *arg_lists, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            # プロセスを起動できない環境では逐次処理にフォールバックする
+            self.close()
+            self._log_warning(f"並列処理を利用できないため逐次処理します: {str(e)}")
+            return list(map(worker, *arg_lists))
 
     def _format_multi_file_type_results(
         self,
@@ -230,39 +679,34 @@ class ExcelFileChecker:
             return "処理対象のファイルが見つかりませんでした。"
 
         # 各ファイルごとに出力を生成
-        output_lines = []
-
-        for i, result in enumerate(results):
-            file_path = file_paths[i]
-
-            # 相対パスを取得
-            try:
-                relative_path = file_path.relative_to(root_dir)
-            except ValueError:
-                relative_path = file_path
-
-            # ヘッダー行を生成
-            header_cols = ["Filename", "Path"] + result["target_cells"]
-            if result["image_check_cells"]:
-                header_cols += [f"{cell}(画像)" for cell in result["image_check_cells"]]
-
-            if not output_lines:
-                # 最初のファイルの場合のみヘッダーを出力
-                output_lines.append("\t".join(header_cols))
-
-            # データ行を生成
-            data_cols = [
-                result["filename"],
-                str(relative_path.parent)
-            ] + [str(val) if val is not None else "" for val in result["cell_values"]]
+        buffer = io.StringIO()
+        writer = self._tsv_writer(buffer)
+        root_prefix = self._root_prefix(root_dir)
+
+        # ヘッダー行は最初のファイルの設定から1回だけ生成して出力
+        first_result = results[0]
+        header_cols = ["Filename", "Path"] + first_result["target_cells"]
+        header_cols += [f"{cell}(画像)" for cell in first_result["image_check_cells"]]
+        writer.writerow(header_cols)
+
+        for result, file_path in zip(results, file_paths):
+            # 相対パスを取得（ルート配下でない場合は絶対パスの親ディレクトリ）
+            path_str = str(file_path)
+            relative_dir = self._relative_dir(path_str, root_prefix)
+            if relative_dir is None:
+                relative_dir = os.path.dirname(path_str) or "."
+
+            # データ行を生成（None は csv.writer が空文字列として書き込む）
+            data_cols = [result["filename"], relative_dir] + result["cell_values"]
 
             # 画像判定結果を追加
             if result["image_check_cells"]:
                 data_cols += result["image_results"]
 
-            output_lines.append("\t".join(data_cols))
+            writer.writerow(data_cols)
 
-        return "\n".join(output_lines)
+        # 従来どおり末尾の改行は含めない
+        return buffer.getvalue()[:-1]
 
     def _determine_file_type(self, filename: str) -> str:
         """ファイル名からファイルタイプを判定
@@ -273,11 +717,8 @@ class ExcelFileChecker:
         Returns:
             "checklist", "record", または None
         """
-        if "レビューチェックリスト" in filename or "checklist" in filename.lower():
-            return "checklist"
-        elif "レビュー記録表" in filename or "記録表" in filename:
-            return "record"
-        return None
+        match = self._FILE_TYPE_PATTERN.match(filename)
+        return match.lastgroup if match else None
 
     def _format_validation_results(
         self,
@@ -293,17 +734,45 @@ class ExcelFileChecker:
         Returns:
             整形された結果文字列
         """
-        if not validation_results:
-            return "処理対象のファイルが見つかりませんでした。"
+        buffer = io.StringIO()
+        self._write_validation_results(buffer, validation_results, root_dir)
+        return buffer.getvalue()
 
-        output_lines = []
+    def _write_validation_results(
+        self,
+        stream: TextIO,
+        validation_results: List[Dict[str, Any]],
+        root_dir: Path
+    ):
+        """検証結果を詳細検証表形式で整形してストリームに書き込む
+
+        出力全体を1つの文字列に連結せず、行ごとに書き込み、
+        batch_size 行ごとにストリームを flush する。
+
+        Args:
+            stream: 書き込み先のテキストストリーム（ファイルハンドルなど）
+            validation_results: 検証結果のリスト
+            root_dir: ルートディレクトリ
+        """
+        if not validation_results:
+            stream.write("処理対象のファイルが見つかりませんでした。")
+            return
 
-        # ヘッダー行を生成
+        # ヘッダー行を書き込み
         headers = [
             "Filename", "Type", "Path", "プロジェクト名", "日付",
             "担当者", "承認者", "捺印", "ペア", "一致状況"
         ]
-        output_lines.append("\t".join(headers))
+        writer = self._tsv_writer(stream)
+        writer.writerow(headers)
+        written_rows = 0
+        root_prefix = self._root_prefix(root_dir)
+
+        # サマリの件数は行の書き込みと同じループで数える
+        complete_pairs = 0
+        checklist_only = 0
+        record_only = 0
+        no_stamp = 0
 
         # 各ペアの結果を出力
         for result in validation_results:
@@ -312,69 +781,80 @@ class ExcelFileChecker:
             record = result["record"]
             validation = result["validation"]
 
+            if validation.get("has_pair"):
+                complete_pairs += 1
+            elif checklist and not record:
+                checklist_only += 1
+            elif record and not checklist:
+                record_only += 1
+
+            if validation.get("has_stamp") is False:
+                no_stamp += 1
+
             # チェックリスト行
             if checklist:
                 checklist_row = self._format_file_row(
-                    checklist, "チェックリスト", root_dir,
+                    checklist, "チェックリスト", root_prefix,
                     validation, project_name
                 )
-                output_lines.append(checklist_row)
+                writer.writerow(checklist_row)
+                written_rows += 1
 
             # 記録表行
             if record:
                 record_row = self._format_file_row(
-                    record, "記録表", root_dir,
+                    record, "記録表", root_prefix,
                     validation, project_name
                 )
-                output_lines.append(record_row)
+                writer.writerow(record_row)
+                written_rows += 1
 
-        # サマリを追加
-        summary = self._generate_summary(validation_results)
-        output_lines.append("")
-        output_lines.append("【サマリ】")
-        output_lines.extend(summary)
+            if written_rows >= self.batch_size:
+                stream.flush()
+                written_rows = 0
 
-        return "\n".join(output_lines)
+        # サマリを追加
+        summary = self._generate_summary(
+            len(validation_results), complete_pairs, checklist_only, record_only, no_stamp
+        )
+        stream.write("\n【サマリ】\n" + "\n".join(summary))
 
     def _format_file_row(
         self,
         file_data: Dict[str, Any],
         file_type: str,
-        root_dir: Path,
+        root_prefix: str,
         validation: Dict[str, Any],
         project_name: str
-    ) -> str:
+    ) -> List[Any]:
         """ファイルデータを行形式に整形
 
         Args:
             file_data: ファイルデータ
             file_type: ファイルタイプ
-            root_dir: ルートディレクトリ
+            root_prefix: _root_prefix で作成したルートディレクトリの文字列
             validation: 検証結果
             project_name: プロジェクト名
 
         Returns:
-            タブ区切りの行文字列
+            行の列値のリスト（csv.writer で書き込む。None は空文字列になる）
         """
         filename = file_data.get("filename", "")
-        file_path = file_data.get("file_path", Path(""))
-        cell_labels = file_data.get("cell_labels", [])
+        file_path = file_data.get("file_path")
+        label_index = get_label_index(file_data)
         cell_values = file_data.get("cell_values", [])
 
-        # 相対パスを取得
-        try:
-            relative_path = file_path.relative_to(root_dir) if file_path else Path("")
-            path_str = str(relative_path.parent) if relative_path.parent != Path(".") else "."
-        except (ValueError, AttributeError):
+        # 相対パスを取得（ルート配下でない場合は "."）
+        path_str = self._relative_dir(str(file_path), root_prefix) if file_path else None
+        if path_str is None:
             path_str = "."
 
         # ラベルから値を取得するヘルパー関数
         def get_value(label):
-            if label in cell_labels:
-                index = cell_labels.index(label)
-                if index < len(cell_values):
-                    return str(cell_values[index]) if cell_values[index] is not None else ""
-            return ""
+            index = label_index.get(label)
+            if index is None or index >= len(cell_values):
+                return None
+            return cell_values[index]
 
         # 各列の値を取得
         date_val = get_value("日付") if file_type == "チェックリスト" else get_value("承認日")
@@ -408,38 +888,75 @@ class ExcelFileChecker:
             status
         ]
 
-        return "\t".join(columns)
+        return columns
 
-    def _generate_summary(self, validation_results: List[Dict[str, Any]]) -> List[str]:
-        """サマリを生成
+    @staticmethod
+    def _tsv_writer(stream: TextIO):
+        """タブ区切りで行を書き込む csv.writer を作成
+
+        値にタブ・改行・ダブルクォートが含まれる場合はダブルクォートで囲んで書き込む。
 
         Args:
-            validation_results: 検証結果のリスト
+            stream: 書き込み先のテキストストリーム
 
         Returns:
-            サマリ行のリスト
+            csv.writer オブジェクト
         """
-        total_pairs = len(validation_results)
-        complete_pairs = 0
-        checklist_only = 0
-        record_only = 0
-        no_stamp = 0
+        return csv.writer(stream, dialect="excel-tab", lineterminator="\n")
 
-        for result in validation_results:
-            validation = result["validation"]
-            checklist = result["checklist"]
-            record = result["record"]
+    @staticmethod
+    def _root_prefix(root_dir: Path) -> str:
+        """相対パスの計算に使うルートディレクトリの文字列を作成
 
-            if validation.get("has_pair"):
-                complete_pairs += 1
-            elif checklist and not record:
-                checklist_only += 1
-            elif record and not checklist:
-                record_only += 1
+        行ごとに Path.relative_to を呼ばず、文字列の前方一致で相対パスを求めるため、
+        ルートディレクトリの文字列に区切り文字を付けておく。
 
-            if validation.get("has_stamp") is False:
-                no_stamp += 1
+        Args:
+            root_dir: ルートディレクトリ
+
+        Returns:
+            末尾に区切り文字を付けたルートディレクトリの文字列（カレントディレクトリの場合は空文字列）
+        """
+        root_str = str(root_dir)
+        if root_str == ".":
+            return ""
+        return os.path.join(root_str, "")
+
+    @staticmethod
+    def _relative_dir(path_str: str, root_prefix: str) -> Optional[str]:
+        """ファイルの親ディレクトリをルートディレクトリからの相対パスで取得
+
+        Args:
+            path_str: ファイルパスの文字列
+            root_prefix: _root_prefix で作成したルートディレクトリの文字列
+
+        Returns:
+            親ディレクトリの相対パス（ルート直下の場合は "."、ルート配下でない場合は None）
+        """
+        if not path_str.startswith(root_prefix):
+            return None
+        return os.path.dirname(path_str[len(root_prefix):]) or "."
+
+    def _generate_summary(
+        self,
+        total_pairs: int,
+        complete_pairs: int,
+        checklist_only: int,
+        record_only: int,
+        no_stamp: int
+    ) -> List[str]:
+        """サマリを生成
+
+        Args:
+            total_pairs: プロジェクト総数
+            complete_pairs: 完全なペアの件数
+            checklist_only: チェックリストのみの件数
+            record_only: 記録表のみの件数
+            no_stamp: 捺印なしの件数
 
+        Returns:
+            サマリ行のリスト
+        """
         summary = [
             f"- プロジェクト総数: {total_pairs}件",
             f"- 完全なペア: {complete_pairs}件",
@@ -450,29 +967,40 @@ class ExcelFileChecker:
 
         return summary
 
-    def _save_results(self, content: str):
-        """結果をファイルに保存
+    def _write_output(self, write: Callable[[TextIO], Any]):
+        """出力ファイルを開き、書き込み関数で結果を書き込む
 
         Args:
-            content: 保存する内容
+            write: 出力ファイルのテキストストリームを受け取って書き込む関数
         """
         # 設定ファイルと同じディレクトリに出力
         output_path = self.config_path.parent / self.config.output_filename
 
         try:
-            output_path.write_text(content, encoding="utf-8")
+            # 書き込んだ文字列はバッファ単位でUTF-8に変換して書き出される
+            # （出力全体の str と bytes を同時にメモリ上に持たない）
+            with output_path.open("w", encoding="utf-8", buffering=self.OUTPUT_BUFFER_SIZE) as stream:
+                write(stream)
             self._log_info(f"結果を保存: {output_path}")
         except Exception as e:
             self._log_error(f"ファイル保存失敗: {output_path} - {str(e)}")
             raise
 
+    def _log_debug(self, message: str):
+        """DEBUGレベルのログを出力（--verbose 指定時のみ表示）
+
+        Args:
+            message: ログメッセージ
+        """
+        logger.debug(message)
+
     def _log_info(self, message: str):
         """INFOレベルのログを出力
 
         Args:
             message: ログメッセージ
         """
-        print(f"[INFO] {message}")
+        logger.info(message)
 
     def _log_warning(self, message: str):
         """WARNINGレベルのログを出力
@@ -480,7 +1008,7 @@ class ExcelFileChecker:
         Args:
             message: ログメッセージ
         """
-        print(f"[WARNING] {message}")
+        logger.warning(message)
 
     def _log_error(self, message: str):
         """ERRORレベルのログを出力
@@ -488,7 +1016,7 @@ class ExcelFileChecker:
         Args:
             message: ログメッセージ
         """
-        print(f"[ERROR] {message}")
+        logger.error(message)
 
 
 def main():
@@ -508,18 +1036,50 @@ def main():
         default="config.ini",
         help="設定ファイル（.ini）のパス（デフォルト: config.ini）"
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="ファイル処理の並列数（デフォルト: CPUコア数、1を指定すると逐次処理）"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="抽出結果のキャッシュを使用しない（全ファイルを読み直す）"
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="処理したファイルごとのログも出力する"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=ExcelFileChecker.DEFAULT_BATCH_SIZE,
+        help=f"出力ファイルへ書き出す行数の単位（デフォルト: {ExcelFileChecker.DEFAULT_BATCH_SIZE}）"
+    )
 
     args = parser.parse_args()
     config_path = Path(args.ini)
 
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     if not config_path.exists():
         print(f"[ERROR] 設定ファイルが見つかりません: {config_path}")
         print("使い方: python run.py -i <設定ファイルのパス>")
         return
 
     try:
-        checker = ExcelFileChecker(config_path)
-        checker.run()
+        with ExcelFileChecker(
+            config_path,
+            use_cache=not args.no_cache,
+            max_workers=args.workers,
+            batch_size=args.batch_size
+        ) as checker:
+            checker.run()
     except Exception as e:
         print(f"[ERROR] 実行エラー: {str(e)}")
         raise
@@ -2,19 +2,117 @@
 
 ファイル抽出結果を視認性の高いフォーマットで整形する。
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO, Tuple
 from pathlib import Path
+from functools import lru_cache
+from itertools import accumulate, zip_longest
+import io
+import re
 import unicodedata
 
 
+# 文字ごとの判定でモジュール属性の参照を繰り返さないよう、関数を直接束縛しておく
+_east_asian_width = unicodedata.east_asian_width
+
+# パディング用の空白文字列（不足幅 → 空白文字列）。列幅がこの範囲に収まる列は作り直さずに使う
+_SPACES = tuple(" " * n for n in range(256))
+
+# サマリのツリー記号（最後の要素かどうか False/True で引く）
+_TREE_CONNECTORS = ("├── ", "└── ")
+_TREE_INDENTS = ("│   ", "    ")
+
+# 基本多言語面（BMP）の範囲。この範囲の文字は全角文字の正規表現で数える
+_BMP_MAX_CHAR = "\uffff"
+
+
+@lru_cache(maxsize=None)
+def _char_width(char: str) -> int:
+    """1文字の表示幅を計算（結果をキャッシュ）
+
+    全角文字の正規表現に含まれない BMP 外の文字（絵文字など）で使用する。
+
+    Args:
+        char: 計算対象の文字
+
+    Returns:
+        全角文字（East Asian Width が F, W）は2、それ以外は1
+    """
+    # 日本語の文字に多い "W" を先に比較する
+    width_class = _east_asian_width(char)
+    if width_class == "W" or width_class == "F":
+        return 2
+    return 1
+
+
+@lru_cache(maxsize=1)
+def _wide_char_pattern() -> re.Pattern:
+    """BMP の全角文字（East Asian Width が F, W）1文字にマッチする正規表現を作成
+
+    全角文字のコードポイントを連続する範囲（数百個）にまとめた文字クラスにする。
+    ワーカープロセスなど出力を整形しないプロセスで作成コストがかからないよう、
+    モジュール読み込み時ではなく最初に必要になった時点で作成する（以降は再利用）。
+
+    Returns:
+        コンパイル済みの正規表現
+    """
+    ranges = []
+    start = None
+    for code_point in range(0x10000):
+        width_class = _east_asian_width(chr(code_point))
+        if width_class == "W" or width_class == "F":
+            if start is None:
+                start = code_point
+        elif start is not None:
+            ranges.append((start, code_point - 1))
+            start = None
+    if start is not None:
+        ranges.append((start, 0xFFFF))
+
+    char_class = "".join(
+        f"{re.escape(chr(first))}-{re.escape(chr(last))}" for first, last in ranges
+    )
+    return re.compile(f"[{char_class}]")
+
+
+@lru_cache(maxsize=8192)
+def _string_width(text: str) -> int:
+    """文字列の表示幅を計算（結果をキャッシュ）
+
+    列幅の計算とパディングで同じ文字列を繰り返し計算するため、文字列単位でもキャッシュする。
+
+    Args:
+        text: 計算対象の文字列
+
+    Returns:
+        表示幅（半角文字換算）
+    """
+    if text and max(text) > _BMP_MAX_CHAR:
+        # BMP 外の文字を含む場合（まれ）は1文字ずつ計算する
+        return sum(map(_char_width, text))
+
+    # 全角文字の数だけ文字数に1を足す（文字ごとの判定は正規表現エンジン内で行う）
+    return len(text) + len(_wide_char_pattern().findall(text))
+
+
 class OutputFormatter:
     """出力整形クラス
 
     Attributes:
         target_cells (List[str]): 抽出対象セルのリスト
         image_check_cells (List[str]): 画像判定対象セルのリスト
+        last_column_offsets (List[int]): 直前に整形した出力の各列の開始位置
+            （表示幅換算、列の区切りは ", "）。揃えて整形していない場合は空リスト
     """
 
+    # 属性は初期化時に決まるため、インスタンスごとの __dict__ を持たない
+    __slots__ = (
+        "target_cells",
+        "image_check_cells",
+        "last_column_offsets",
+        "_header",
+        "_header_widths",
+    )
+
     def __init__(self, target_cells: List[str], image_check_cells: List[str]):
         """出力整形の初期化
 
@@ -25,6 +123,13 @@ class OutputFormatter:
         self.target_cells = target_cells
         self.image_check_cells = image_check_cells
 
+        # ヘッダー行の列名と表示幅は設定から決まるため、初期化時に1回だけ計算する
+        self._header = self._header_columns()
+        self._header_widths = [self._display_width(col) for col in self._header]
+
+        # 出力を読み直して列位置を探さずに済むよう、整形時の列の開始位置を公開する
+        self.last_column_offsets: List[int] = []
+
     def format_results(
         self,
         results: List[Dict[str, Any]],
@@ -42,30 +147,62 @@ class OutputFormatter:
         Returns:
             整形された結果文字列（カンマ位置が垂直に揃う）
         """
-        # 空の場合はヘッダーのみ返す
-        if not results:
-            return self._generate_header() + "\n"
-
-        # 各列の最大幅を計算
-        column_widths = self._calculate_column_widths(results)
+        buffer = io.StringIO()
+        self.write_results(buffer, results, root_dir=root_dir, file_paths=file_paths)
+        return buffer.getvalue()
 
-        # ヘッダー行を生成
-        output_lines = [self._generate_header_with_padding(column_widths)]
+    def write_results(
+        self,
+        stream: TextIO,
+        results: List[Dict[str, Any]],
+        root_dir: Optional[Path] = None,
+        file_paths: Optional[List[Path]] = None,
+        batch_size: Optional[int] = None
+    ):
+        """抽出結果を整形してストリームに書き込む
 
-        # 各結果行を整形
-        for result in results:
-            formatted_row = self._format_row_with_padding(result, column_widths)
-            output_lines.append(formatted_row)
+        出力全体を1つの文字列に連結せず、行ごとに書き込む。
+        列幅を揃えるため、書き込み前に全結果から各列の最大幅を計算する。
+        batch_size を指定した場合は、その行数ごとにストリームを flush する。
 
-        # 基本出力
-        output = "\n".join(output_lines) + "\n"
+        Args:
+            stream: 書き込み先のテキストストリーム（ファイルハンドルなど）
+            results: 各ファイルの抽出結果のリスト
+                形式: [{"filename": str, "cell_values": List[Any], "image_results": List[str]}, ...]
+            root_dir: ルートディレクトリ（サマリ用、オプション）
+            file_paths: ファイルパスのリスト（サマリ用、オプション）
+            batch_size: flush する行数の単位（省略時は flush しない）
+        """
+        # 空の場合はヘッダーのみ書き込む
+        if not results:
+            self.last_column_offsets = []
+            stream.write(self._generate_header() + "\n")
+            return
+
+        # 各行を1回だけ文字列化し、列ごとにまとめて列幅の計算とパディングを行う
+        rows = [self._row_columns(result) for result in results]
+        column_widths, padded_columns = self._pad_columns(rows)
+        # 各列の開始位置（先頭列は0、以降は前の列の幅と区切りの ", " の分だけ右）
+        self.last_column_offsets = [0, *accumulate(width + 2 for width in column_widths[:-1])]
+
+        # ヘッダー行を書き込み
+        stream.write(self._join_padded(self._header, self._header_widths, column_widths) + "\n")
+
+        # パディング済みの列を行に戻して連結し、batch_size 行ごと（省略時は全行）に1回の write で書き込む
+        lines: List[str] = []
+        for row in zip(*padded_columns):
+            lines.append(", ".join(row))
+            lines.append("\n")
+            if batch_size and len(lines) >= batch_size * 2:
+                stream.write("".join(lines))
+                stream.flush()
+                lines.clear()
+        stream.write("".join(lines))
 
         # サマリを追加（root_dirとfile_pathsが指定されている場合）
         if root_dir is not None and file_paths is not None:
-            summary = self._generate_summary(root_dir, file_paths)
-            output += "\n\n" + summary
-
-        return output
+            stream.write("\n\n")
+            self._write_summary(stream, root_dir, file_paths)
 
     def _generate_header(self) -> str:
         """ヘッダー行を生成（パディングなし）
@@ -73,40 +210,24 @@ class OutputFormatter:
         Returns:
             ヘッダー文字列（例: "Filename, A1, B1, C1, D1(画像), E1(画像)"）
         """
-        columns = ["Filename"]
-
-        # target_cellsを追加
-        columns.extend(self.target_cells)
-
-        # image_check_cellsを追加（"セル名(画像)"形式）
-        for cell in self.image_check_cells:
-            columns.append(f"{cell}(画像)")
+        return ", ".join(self._header)
 
-        return ", ".join(columns)
-
-    def _generate_header_with_padding(self, column_widths: List[int]) -> str:
-        """ヘッダー行をパディング付きで生成
-
-        Args:
-            column_widths: 各列の最大幅のリスト
+    def _header_columns(self) -> List[str]:
+        """ヘッダー行の列名のリストを生成
 
         Returns:
-            パディング済みヘッダー文字列
+            列名のリスト（例: ["Filename", "A1", "B1", "D1(画像)"]）
         """
         columns = ["Filename"]
+
+        # target_cellsを追加
         columns.extend(self.target_cells)
 
+        # image_check_cellsを追加（"セル名(画像)"形式）
         for cell in self.image_check_cells:
             columns.append(f"{cell}(画像)")
 
-        # 各列をパディング
-        padded_columns = []
-        for i, col in enumerate(columns):
-            width = column_widths[i]
-            padded = self._pad_string(col, width)
-            padded_columns.append(padded)
-
-        return ", ".join(padded_columns)
+        return columns
 
     def _format_row(self, result: Dict[str, Any]) -> str:
         """単一の結果行を整形（パディングなし）
@@ -118,85 +239,80 @@ class OutputFormatter:
         Returns:
             整形された行文字列
         """
-        columns = [result["filename"]]
-
-        # セル値を追加（文字列に変換）
-        for value in result["cell_values"]:
-            columns.append(str(value))
+        return ", ".join(self._row_columns(result))
 
-        # 画像判定結果を追加
-        columns.extend(result["image_results"])
-
-        return ", ".join(columns)
-
-    def _format_row_with_padding(
-        self, result: Dict[str, Any], column_widths: List[int]
-    ) -> str:
-        """単一の結果行をパディング付きで整形
+    def _row_columns(self, result: Dict[str, Any]) -> List[str]:
+        """単一の結果行の列値を文字列のリストに変換
 
         Args:
             result: ファイルの抽出結果
-            column_widths: 各列の最大幅のリスト
 
         Returns:
-            パディング済み行文字列
+            列値の文字列のリスト（ファイル名、セル値、画像判定結果の順）
         """
-        columns = [result["filename"]]
-
-        # セル値を追加（文字列に変換）
-        for value in result["cell_values"]:
-            columns.append(str(value))
-
-        # 画像判定結果を追加
-        columns.extend(result["image_results"])
+        # ファイル名、セル値（文字列に変換）、画像判定結果の順
+        # 各値の文字列化は行ごとに1回だけ行い、列幅の計算とパディングで使い回す
+        return [result["filename"], *map(str, result["cell_values"]), *result["image_results"]]
 
-        # 各列をパディング
-        padded_columns = []
-        for i, col in enumerate(columns):
-            width = column_widths[i]
-            padded = self._pad_string(col, width)
-            padded_columns.append(padded)
+    def _pad_columns(self, rows: List[List[str]]) -> Tuple[List[int], List[List[str]]]:
+        """全行の列値を列ごとにまとめ、各列の最大幅まで表示幅を揃える
 
-        return ", ".join(padded_columns)
-
-    def _calculate_column_widths(self, results: List[Dict[str, Any]]) -> List[int]:
-        """各列の最大幅を計算
+        行単位ではなく列単位で処理し、各セルの表示幅は1回だけ計算して
+        最大幅の計算（max）とパディングの両方に使う。
+        列数が揃っていない行やヘッダーより列数が少ない行は、不足する列を空文字列として扱う。
 
         Args:
-            results: 各ファイルの抽出結果のリスト
+            rows: 各行の列値の文字列のリスト
 
         Returns:
-            各列の最大幅のリスト（日本語文字も考慮）
+            (各列の最大幅のリスト, パディング済みの列ごとの値のリスト) のタプル
         """
-        # ヘッダー行の列名を取得
-        header_columns = ["Filename"]
-        header_columns.extend(self.target_cells)
-        for cell in self.image_check_cells:
-            header_columns.append(f"{cell}(画像)")
-
-        # 各列の最大幅を初期化（ヘッダーの幅）
-        column_widths = [self._display_width(col) for col in header_columns]
+        display_width = self._display_width
+        header_widths = self._header_widths
+        column_widths: List[int] = []
+        padded_columns: List[List[str]] = []
+
+        # ヘッダーも一緒にまとめ、全行がヘッダーより短い場合もヘッダーの列数分の列を作る
+        for j, (_, *column) in enumerate(zip_longest(self._header, *rows, fillvalue="")):
+            widths = list(map(display_width, column))
+            column_width = max(widths)
+            if j < len(header_widths) and header_widths[j] > column_width:
+                column_width = header_widths[j]
+            column_widths.append(column_width)
+
+            # 各セルは不足幅に対応する空白文字列を連結するのみ行う
+            # （列幅は各セルの表示幅以上のため、不足幅が負になることはない）。
+            # 通常は共通の _SPACES を使い、幅の広い列のみ現れる不足幅の分だけ作る
+            if column_width < len(_SPACES):
+                pads = _SPACES
+            else:
+                pads = {n: " " * n for n in {column_width - width for width in widths}}
+            padded_columns.append([
+                value + pads[column_width - width]
+                for value, width in zip(column, widths)
+            ])
 
-        # 各結果行の幅をチェック
-        for result in results:
-            # ファイル名の幅
-            filename_width = self._display_width(result["filename"])
-            column_widths[0] = max(column_widths[0], filename_width)
+        return column_widths, padded_columns
 
-            # セル値の幅
-            for i, value in enumerate(result["cell_values"]):
-                value_width = self._display_width(str(value))
-                column_widths[i + 1] = max(column_widths[i + 1], value_width)
+    def _join_padded(
+        self, columns: List[str], widths: List[int], column_widths: List[int]
+    ) -> str:
+        """各列をパディングしてカンマ区切りで連結
 
-            # 画像判定結果の幅
-            offset = 1 + len(result["cell_values"])
-            for i, image_result in enumerate(result["image_results"]):
-                result_width = self._display_width(image_result)
-                column_widths[offset + i] = max(
-                    column_widths[offset + i], result_width
-                )
+        Args:
+            columns: 列値の文字列のリスト
+            widths: 各列値の表示幅のリスト（計算済みの値を再利用する）
+            column_widths: 各列の最大幅のリスト
 
-        return column_widths
+        Returns:
+            パディング済み行文字列
+        """
+        # 表示幅ではなく文字数で指定するため、列値の文字数に不足分の幅を足した長さに揃える
+        # （不足幅が0以下の場合、str.ljust は元の文字列をそのまま返す）
+        return ", ".join([
+            col.ljust(len(col) + column_widths[j] - widths[j])
+            for j, col in enumerate(columns)
+        ])
 
     def _display_width(self, text: str) -> int:
         """文字列の表示幅を計算（日本語文字は幅2、半角文字は幅1）
@@ -207,62 +323,31 @@ class OutputFormatter:
         Returns:
             表示幅（半角文字換算）
         """
-        width = 0
-        for char in text:
-            # East Asian Width プロパティを取得
-            east_asian_width = unicodedata.east_asian_width(char)
-
-            # 全角文字（F, W）は幅2、それ以外は幅1
-            if east_asian_width in ("F", "W"):
-                width += 2
-            else:
-                width += 1
-
-        return width
-
-    def _pad_string(self, text: str, target_width: int) -> str:
-        """文字列を指定幅までスペースでパディング
-
-        Args:
-            text: パディング対象の文字列
-            target_width: 目標幅（半角文字換算）
-
-        Returns:
-            パディング済み文字列
-        """
-        current_width = self._display_width(text)
-        padding_needed = target_width - current_width
-
-        # パディングが負の場合は0にする
-        if padding_needed < 0:
-            padding_needed = 0
+        # ASCIIのみの文字列（列名・数値など）は文字数がそのまま表示幅になる
+        if text.isascii():
+            return len(text)
+        return _string_width(text)
 
-        return text + " " * padding_needed
+    def _write_summary(self, stream: TextIO, root_dir: Path, file_paths: List[Path]):
+        """サマリセクションをストリームに書き込む
 
-    def _generate_summary(self, root_dir: Path, file_paths: List[Path]) -> str:
-        """サマリセクションを生成
+        サマリ全体を行のリストから連結せず、1行ずつ書き込む。
 
         Args:
+            stream: 書き込み先のテキストストリーム
             root_dir: ルートディレクトリ
             file_paths: ファイルパスのリスト
-
-        Returns:
-            サマリ文字列
         """
-        summary_lines = []
-        summary_lines.append("=== サマリ ===")
-        summary_lines.append(f"出力対象ファイル件数: {len(file_paths)}件")
-        summary_lines.append("")
-
-        # ツリー構造を生成
-        tree = self._generate_tree(root_dir, file_paths)
-        summary_lines.append(tree)
+        stream.write("=== サマリ ===\n")
+        stream.write(f"出力対象ファイル件数: {len(file_paths)}件\n\n")
 
-        summary_lines.append("=============")
+        # ツリー構造を書き込み
+        for line in self._generate_tree(root_dir, file_paths):
+            stream.write(line + "\n")
 
-        return "\n".join(summary_lines)
+        stream.write("=============")
 
-    def _generate_tree(self, root_dir: Path, file_paths: List[Path]) -> str:
+    def _generate_tree(self, root_dir: Path, file_paths: List[Path]) -> List[str]:
         """ファイルツリー構造を生成
 
         Args:
@@ -270,21 +355,26 @@ class OutputFormatter:
             file_paths: ファイルパスのリスト
 
         Returns:
-            ツリー構造の文字列
+            ツリー構造の行のリスト
         """
-        # ファイルパスをソート
-        sorted_paths = sorted(file_paths)
-
         # ルートディレクトリを表示
         tree_lines = [f"{root_dir}/"]
 
         # ディレクトリ構造を構築
-        # 各ファイルの相対パスを取得
+        # 各ファイルの相対パスを取得（並び順は build_tree が階層ごとに名前順に揃えるため、
+        # 事前にファイルパス全体をソートする必要はない）
+        # （ルート配下のパスは parts の前方一致で求め、Path.relative_to による Path の生成を省く）
+        root_parts = root_dir.parts
+        root_len = len(root_parts)
         file_tree = {}
-        for file_path in sorted_paths:
+        for file_path in file_paths:
             try:
-                rel_path = file_path.relative_to(root_dir)
-                parts = rel_path.parts
+                parts = file_path.parts
+                if parts[:root_len] == root_parts:
+                    parts = parts[root_len:]
+                else:
+                    # 大文字小文字の違いなどは relative_to の判定に任せる
+                    parts = file_path.relative_to(root_dir).parts
                 current = file_tree
                 for part in parts:
                     if part not in current:
@@ -304,29 +394,26 @@ class OutputFormatter:
         def build_tree(tree_dict: Dict, prefix: str = "", is_last: bool = True) -> List[str]:
             """ツリー構造を再帰的に構築"""
             lines = []
-            items = sorted(tree_dict.keys())
+            items = sorted(tree_dict)
+            last_index = len(items) - 1
 
             for i, item in enumerate(items):
-                is_last_item = (i == len(items) - 1)
-                connector = "└── " if is_last_item else "├── "
+                # ツリー記号は最後の要素かどうか（False/True）をインデックスにして選ぶ
+                is_last_item = i == last_index
+                children = tree_dict[item]
 
                 # ディレクトリかファイルかを判定
-                if tree_dict[item]:  # 子要素がある場合はディレクトリ
-                    lines.append(f"{prefix}{connector}{item}/")
-                    # 次のレベルのプレフィックスを設定
-                    if is_last_item:
-                        next_prefix = prefix + "    "
-                    else:
-                        next_prefix = prefix + "│   "
-                    # 再帰的に子要素を処理
-                    child_lines = build_tree(tree_dict[item], next_prefix, is_last_item)
-                    lines.extend(child_lines)
+                if children:  # 子要素がある場合はディレクトリ
+                    lines.append(f"{prefix}{_TREE_CONNECTORS[is_last_item]}{item}/")
+                    # 次のレベルのプレフィックスを設定し、再帰的に子要素を処理
+                    next_prefix = prefix + _TREE_INDENTS[is_last_item]
+                    lines.extend(build_tree(children, next_prefix, is_last_item))
                 else:  # 子要素がない場合はファイル
-                    lines.append(f"{prefix}{connector}{item}")
+                    lines.append(f"{prefix}{_TREE_CONNECTORS[is_last_item]}{item}")
 
             return lines
 
         tree_content = build_tree(file_tree)
         tree_lines.extend(tree_content)
 
-        return "\n".join(tree_lines)
+        return tree_lines
@@ -0,0 +1,167 @@
+"""抽出結果キャッシュモジュール
+
+ファイルごとの抽出結果（セル値・画像判定結果）をディスクにキャッシュし、
+変更のないファイルを再実行時に読み直さずに済むようにする。
+"""
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ResultCache:
+    """抽出結果キャッシュクラス
+
+    キャッシュキーは「キャッシュの版・ファイルパス・サイズ・更新日時（ns）・抽出設定」から生成する。
+    ファイルが更新されるか抽出設定が変わると別のキーになるため、古い結果は参照されない。
+    参照されないまま MAX_AGE_SECONDS を過ぎたキャッシュは prune で削除する。
+
+    Attributes:
+        cache_dir (Path): キャッシュファイルの保存先ディレクトリ
+    """
+
+    # キャッシュファイルの拡張子
+    CACHE_SUFFIX = ".pkl"
+
+    # キャッシュの版。セル値の変換規則や結果の形式など、抽出結果が変わる変更をしたら上げる
+    # （上げると以前の版で保存したキャッシュは参照されなくなる）
+    CACHE_VERSION = 2
+
+    # 参照されないキャッシュを残しておく期間（秒）
+    MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+    def __init__(self, cache_dir: Path):
+        """キャッシュの初期化
+
+        Args:
+            cache_dir: キャッシュファイルの保存先ディレクトリ（存在しない場合は書き込み時に作成）
+        """
+        self.cache_dir = cache_dir
+
+    def get(self, file_path: Path, signature: str) -> Optional[Dict[str, Any]]:
+        """キャッシュされた抽出結果を取得
+
+        Args:
+            file_path: 対象ファイルのパス
+            signature: 抽出設定を表す文字列（シート名・対象セルなど）
+
+        Returns:
+            キャッシュされた結果の辞書。キャッシュがない、または読み込めない場合はNone
+        """
+        key = self._make_key(file_path, signature)
+        if key is None:
+            return None
+
+        cache_path = self.cache_dir / f"{key}{self.CACHE_SUFFIX}"
+        try:
+            with cache_path.open("rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 壊れた・互換性のないキャッシュは削除し、キャッシュなしとして再処理させる
+            self._remove(cache_path)
+            return None
+
+        # ハッシュ衝突に備えてファイルパスも照合する
+        if not isinstance(entry, dict) or entry.get("file_path") != str(file_path):
+            return None
+
+        # 参照されたキャッシュは prune で削除されないよう更新日時を更新する
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        return entry.get("result")
+
+    def put(self, file_path: Path, signature: str, result: Dict[str, Any]):
+        """抽出結果をキャッシュに保存
+
+        キャッシュの保存に失敗しても処理全体は継続できるため、例外は送出しない。
+
+        Args:
+            file_path: 対象ファイルのパス
+            signature: 抽出設定を表す文字列（シート名・対象セルなど）
+            result: 保存する抽出結果の辞書
+        """
+        key = self._make_key(file_path, signature)
+        if key is None:
+            return
+
+        cache_path = self.cache_dir / f"{key}{self.CACHE_SUFFIX}"
+        entry = {"file_path": str(file_path), "result": result}
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 書き込み途中のファイルを読まないよう、一時ファイルに書いてから置き換える
+            tmp_path = cache_path.with_suffix(f"{self.CACHE_SUFFIX}.{os.getpid()}.tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
+    def prune(self, max_age: Optional[float] = None):
+        """一定期間参照されていないキャッシュを削除
+
+        取得・保存のたびにキャッシュファイルの更新日時が新しくなるため、
+        更新日時が max_age 秒より古いものは参照されていないとみなす。
+        削除に失敗しても処理全体は継続できるため、例外は送出しない。
+
+        Args:
+            max_age: 残しておく期間（秒、省略時は MAX_AGE_SECONDS）
+        """
+        if max_age is None:
+            max_age = self.MAX_AGE_SECONDS
+        expires = time.time() - max_age
+
+        try:
+            entries = os.scandir(self.cache_dir)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                # 書き込みに失敗した一時ファイルも同様に削除する
+                if not (entry.name.endswith(self.CACHE_SUFFIX) or entry.name.endswith(".tmp")):
+                    continue
+                try:
+                    if entry.stat().st_mtime < expires:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _remove(cache_path: Path):
+        """キャッシュファイルを削除（失敗しても例外は送出しない）
+
+        Args:
+            cache_path: 削除するキャッシュファイルのパス
+        """
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+    def _make_key(self, file_path: Path, signature: str) -> Optional[str]:
+        """キャッシュキーを生成
+
+        Args:
+            file_path: 対象ファイルのパス
+            signature: 抽出設定を表す文字列
+
+        Returns:
+            キャッシュキー（16進文字列）。ファイル情報を取得できない場合はNone
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        source = (
+            f"{self.CACHE_VERSION}:{file_path}:{stat.st_size}:{stat.st_mtime_ns}:{signature}"
+        )
+        return hashlib.blake2b(source.encode("utf-8"), digest_size=20).hexdigest()
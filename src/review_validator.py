@@ -1,6 +1,42 @@
 """レビュー文書のペアリングと検証を行うサービス"""
-from typing import List, Dict, Any, Optional
+import bisect
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
+from src.config_loader import build_label_index
+
+
+@lru_cache(maxsize=128)
+def _cached_label_index(cell_labels: Tuple[str, ...]) -> Dict[str, int]:
+    """ラベル名のタプルからラベル → 位置の辞書を作成（同じラベル構成は再作成しない）
+
+    Args:
+        cell_labels: ラベル名のタプル
+
+    Returns:
+        ラベル名をキー、位置を値とする辞書（共有されるため変更しないこと）
+    """
+    return build_label_index(cell_labels)
+
+
+def get_label_index(data: Dict[str, Any]) -> Dict[str, int]:
+    """ファイルデータのラベル → 位置の辞書を取得
+
+    処理結果に作成済みの "cell_label_index" があればそれを使い、
+    ない場合（古いキャッシュなど）は "cell_labels" から作成する。
+    作成した辞書はラベル構成ごとにキャッシュし、ファイルデータには格納しない。
+
+    Args:
+        data: ファイルデータ
+
+    Returns:
+        ラベル名をキー、位置を値とする辞書
+    """
+    label_index = data.get("cell_label_index")
+    if label_index is None:
+        label_index = _cached_label_index(tuple(data.get("cell_labels", ())))
+    return label_index
 
 
 class ReviewPair:
@@ -12,8 +48,32 @@ class ReviewPair:
             project_name: プロジェクト名
         """
         self.project_name = project_name
-        self.checklist: Optional[Dict[str, Any]] = None
-        self.record: Optional[Dict[str, Any]] = None
+        self._checklist: Optional[Dict[str, Any]] = None
+        self._record: Optional[Dict[str, Any]] = None
+        # validate の結果（checklist・record が変わるまで再利用する）
+        self._cached_validation: Optional[Dict[str, Any]] = None
+
+    @property
+    def checklist(self) -> Optional[Dict[str, Any]]:
+        """チェックリストのファイルデータ"""
+        return self._checklist
+
+    @checklist.setter
+    def checklist(self, data: Optional[Dict[str, Any]]):
+        # 属性へ直接代入された場合も検証結果を作り直す
+        self._checklist = data
+        self._cached_validation = None
+
+    @property
+    def record(self) -> Optional[Dict[str, Any]]:
+        """記録表のファイルデータ"""
+        return self._record
+
+    @record.setter
+    def record(self, data: Optional[Dict[str, Any]]):
+        # 属性へ直接代入された場合も検証結果を作り直す
+        self._record = data
+        self._cached_validation = None
 
     def set_checklist(self, data: Dict[str, Any]):
         """チェックリストを設定"""
@@ -36,7 +96,9 @@ class ReviewPair:
         return self.checklist is None and self.record is not None
 
     def validate(self) -> Dict[str, Any]:
-        """ペアの検証を実行
+        """ペアの検証を実行（結果はチェックリスト・記録表が再設定されるまでキャッシュする）
+
+        呼び出し元で結果を変更してもキャッシュに影響しないよう、コピーを返す。
 
         Returns:
             検証結果の辞書
@@ -49,6 +111,17 @@ class ReviewPair:
                 "warnings": List[str]
             }
         """
+        validation = self._cached_validation
+        if validation is None:
+            validation = self._cached_validation = self._validate()
+        return {**validation, "warnings": list(validation["warnings"])}
+
+    def _validate(self) -> Dict[str, Any]:
+        """ペアの検証を実行（validate から呼び出す）
+
+        Returns:
+            検証結果の辞書（形式は validate を参照）
+        """
         warnings = []
 
         if not self.has_both():
@@ -77,6 +150,16 @@ class ReviewPair:
                     "status": status,
                     "warnings": ["レビューチェックリストが見つかりません"] + warnings
                 }
+            else:
+                # どちらも設定されていない場合は検証するものがないため、ここで終了する
+                return {
+                    "has_pair": False,
+                    "date_match": None,
+                    "reviewer_match": None,
+                    "has_stamp": None,
+                    "status": "⚠️ 両方なし",
+                    "warnings": ["レビューチェックリストとレビュー記録表が見つかりません"]
+                }
 
         # 両方ある場合の検証
         date_match = self._validate_date()
@@ -122,8 +205,9 @@ class ReviewPair:
 
         # 承認日から日付部分を抽出（"承認日: 2025-01-15" → "2025-01-15"）
         record_date_str = str(record_date)
-        if ":" in record_date_str:
-            record_date_str = record_date_str.split(":", 1)[1].strip()
+        _, separator, date_part = record_date_str.partition(":")
+        if separator:
+            record_date_str = date_part.strip()
 
         return str(checklist_date) == record_date_str
 
@@ -143,8 +227,9 @@ class ReviewPair:
 
         # レビュアーから名前部分を抽出（"レビュアー: 山田太郎" → "山田太郎"）
         record_reviewer_str = str(record_reviewer)
-        if ":" in record_reviewer_str:
-            record_reviewer_str = record_reviewer_str.split(":", 1)[1].strip()
+        _, separator, name_part = record_reviewer_str.partition(":")
+        if separator:
+            record_reviewer_str = name_part.strip()
 
         return str(checklist_reviewer) == record_reviewer_str
 
@@ -170,14 +255,10 @@ class ReviewPair:
         Returns:
             対応する値、見つからない場合はNone
         """
-        cell_labels = data.get("cell_labels", [])
         cell_values = data.get("cell_values", [])
 
-        if label not in cell_labels:
-            return None
-
-        index = cell_labels.index(label)
-        if index >= len(cell_values):
+        index = get_label_index(data).get(label)
+        if index is None or index >= len(cell_values):
             return None
 
         return cell_values[index]
@@ -188,7 +269,11 @@ class ReviewValidator:
 
     def __init__(self):
         """初期化"""
-        self.pairs: Dict[str, ReviewPair] = {}
+        self._pairs: Dict[str, ReviewPair] = {}
+        # プロジェクト名 → ペアの読み取り専用ビュー（ペアの追加は add_file のみで行う）
+        self.pairs: Mapping[str, ReviewPair] = MappingProxyType(self._pairs)
+        # プロジェクト名の昇順リスト（add_file で挿入し、validate_all で毎回ソートしない）
+        self._sorted_names: List[str] = []
 
     def add_file(self, file_data: Dict[str, Any], file_type: str):
         """ファイルを追加してペアリング
@@ -205,14 +290,13 @@ class ReviewValidator:
                 }
             file_type: ファイルタイプ（"checklist" or "record"）
         """
-        # プロジェクト名を取得
         project_name = self._extract_project_name(file_data)
 
         # ペアを取得または作成
-        if project_name not in self.pairs:
-            self.pairs[project_name] = ReviewPair(project_name)
-
-        pair = self.pairs[project_name]
+        pair = self._pairs.get(project_name)
+        if pair is None:
+            pair = self._pairs[project_name] = ReviewPair(project_name)
+            bisect.insort(self._sorted_names, project_name)
 
         # ファイルタイプに応じて設定
         if file_type == "checklist":
@@ -228,8 +312,8 @@ class ReviewValidator:
         """
         results = []
 
-        for project_name in sorted(self.pairs.keys()):
-            pair = self.pairs[project_name]
+        for project_name in self._sorted_names:
+            pair = self._pairs[project_name]
             validation = pair.validate()
 
             result = {
@@ -251,14 +335,12 @@ class ReviewValidator:
         Returns:
             プロジェクト名
         """
-        cell_labels = file_data.get("cell_labels", [])
         cell_values = file_data.get("cell_values", [])
 
         # "プロジェクト名"ラベルに対応する値を取得
-        if "プロジェクト名" in cell_labels:
-            index = cell_labels.index("プロジェクト名")
-            if index < len(cell_values):
-                return str(cell_values[index])
+        index = get_label_index(file_data).get("プロジェクト名")
+        if index is not None and index < len(cell_values):
+            return str(cell_values[index])
 
         # 見つからない場合はファイル名から推測
         filename = file_data.get("filename", "Unknown")
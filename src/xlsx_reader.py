@@ -0,0 +1,520 @@
+"""XLSX軽量読み込みモジュール
+
+openpyxlのワークブックモデル（スタイル・全セル・リレーション等）を構築せずに、
+XLSXファイル（ZIP + XML）を直接読み込んで指定セルの値だけを取り出す。
+"""
+import hashlib
+import io
+import posixpath
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from xml.etree import ElementTree as ET
+
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH, from_ISO8601, from_excel
+
+from src.cell_address import CellPosition, parse_cell_address, parse_cell_positions
+
+# XML名前空間
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DRAWING_NS = "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing"
+
+# 使用するタグ名（名前空間付き）
+_SHEET_TAG = f"{{{_MAIN_NS}}}sheet"
+_WORKBOOK_PR_TAG = f"{{{_MAIN_NS}}}workbookPr"
+_ROW_TAG = f"{{{_MAIN_NS}}}row"
+_CELL_TAG = f"{{{_MAIN_NS}}}c"
+_VALUE_TAG = f"{{{_MAIN_NS}}}v"
+_INLINE_STRING_TAG = f"{{{_MAIN_NS}}}is"
+_TEXT_TAG = f"{{{_MAIN_NS}}}t"
+_RUN_TAG = f"{{{_MAIN_NS}}}r"
+_SHARED_STRING_TAG = f"{{{_MAIN_NS}}}si"
+_NUM_FMT_TAG = f"{{{_MAIN_NS}}}numFmt"
+_CELL_XFS_TAG = f"{{{_MAIN_NS}}}cellXfs"
+_XF_TAG = f"{{{_MAIN_NS}}}xf"
+_RELATIONSHIP_TAG = f"{{{_PKG_REL_NS}}}Relationship"
+_REL_ID_ATTR = f"{{{_DOC_REL_NS}}}id"
+
+# 描画パーツ（xl/drawings/drawingN.xml）のタグ名
+_ONE_CELL_ANCHOR_TAG = f"{{{_DRAWING_NS}}}oneCellAnchor"
+_TWO_CELL_ANCHOR_TAG = f"{{{_DRAWING_NS}}}twoCellAnchor"
+_ANCHOR_FROM_TAG = f"{{{_DRAWING_NS}}}from"
+_ANCHOR_COL_TAG = f"{{{_DRAWING_NS}}}col"
+_ANCHOR_ROW_TAG = f"{{{_DRAWING_NS}}}row"
+_PICTURE_TAG = f"{{{_DRAWING_NS}}}pic"
+
+# リレーションの種類（Type属性の末尾で判定）
+_REL_OFFICE_DOCUMENT = "/officeDocument"
+_REL_WORKSHEET = "/worksheet"
+_REL_SHARED_STRINGS = "/sharedStrings"
+_REL_STYLES = "/styles"
+_REL_DRAWING = "/drawing"
+
+# 解析済み共有文字列テーブルのキャッシュ（sharedStrings.xml のハッシュ → 文字列のタプル）
+# 同じテンプレートから作られたファイルは共有文字列が一致することが多いため、
+# プロセス内で直近のテーブルを保持して再解析を省略する
+_SHARED_STRINGS_CACHE: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+_SHARED_STRINGS_CACHE_SIZE = 8
+
+
+def _read_relationships(zf: zipfile.ZipFile, part_path: str) -> List[Tuple[str, str, str]]:
+    """パーツに対応するリレーション（.rels）を読み込む
+
+    Args:
+        zf: XLSXファイルのZipFile
+        part_path: リレーション元のパーツのパス（例: "xl/workbook.xml"）。
+            パッケージ全体のリレーションの場合は空文字列
+
+    Returns:
+        (Id, Type, 解決済みのTargetパス) のタプルのリスト。.relsが存在しない場合は空リスト
+    """
+    base_dir = posixpath.dirname(part_path)
+    rels_path = posixpath.join(base_dir, "_rels", posixpath.basename(part_path) + ".rels")
+
+    try:
+        root = ET.fromstring(zf.read(rels_path))
+    except KeyError:
+        return []
+
+    relationships = []
+    for rel in root.iter(_RELATIONSHIP_TAG):
+        # 外部リンクなどZIP内に存在しないターゲットは対象外
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        # "/xl/..." 形式は絶対パス、それ以外はリレーション元からの相対パス
+        if target.startswith("/"):
+            resolved = target[1:]
+        else:
+            resolved = posixpath.normpath(posixpath.join(base_dir, target))
+        relationships.append((rel.get("Id", ""), rel.get("Type", ""), resolved))
+
+    return relationships
+
+
+def _text_content(element: ET.Element) -> str:
+    """文字列要素（<si>, <is>）から書式を除いたテキストを取り出す
+
+    ふりがな（<rPh>）はセルの値に含めない（openpyxlと同じ扱い）。
+
+    Args:
+        element: <si> または <is> 要素
+
+    Returns:
+        テキスト
+    """
+    snippets = []
+    plain = element.find(_TEXT_TAG)
+    if plain is not None and plain.text:
+        snippets.append(plain.text)
+    for run in element.iterfind(_RUN_TAG):
+        text = run.find(_TEXT_TAG)
+        if text is not None and text.text:
+            snippets.append(text.text)
+    return "".join(snippets)
+
+
+def _parse_shared_strings(data: bytes) -> Tuple[str, ...]:
+    """sharedStrings.xml を解析して共有文字列のタプルを返す（同一内容は再解析しない）
+
+    Args:
+        data: sharedStrings.xml の内容
+
+    Returns:
+        共有文字列のタプル
+    """
+    digest = hashlib.sha1(data).digest()
+    cached = _SHARED_STRINGS_CACHE.get(digest)
+    if cached is not None:
+        _SHARED_STRINGS_CACHE.move_to_end(digest)
+        return cached
+
+    strings = []
+    for _, element in ET.iterparse(io.BytesIO(data)):
+        if element.tag == _SHARED_STRING_TAG:
+            strings.append(_text_content(element).replace("x005F_", ""))
+            element.clear()
+    parsed = tuple(strings)
+
+    _SHARED_STRINGS_CACHE[digest] = parsed
+    if len(_SHARED_STRINGS_CACHE) > _SHARED_STRINGS_CACHE_SIZE:
+        _SHARED_STRINGS_CACHE.popitem(last=False)
+    return parsed
+
+
+def _cast_number(value: str):
+    """数値文字列を int または float に変換（openpyxlと同じ規則）"""
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+class XlsxReader:
+    """XLSX軽量リーダークラス
+
+    ワークシートのXMLを先頭からストリーミングで解析し、対象セルがすべて見つかるか
+    対象セルの最大行を過ぎた時点で読み込みを打ち切る。
+    共有文字列・スタイルは必要になった場合のみ読み込む。
+
+    Attributes:
+        file_path (Path): 対象ファイルのパス
+        sheet_names (List[str]): ワークシート名のリスト（ブック内の順序）
+    """
+
+    def __init__(self, file_path: Path):
+        """XLSXファイルを開いてブック構成を読み込む
+
+        Args:
+            file_path: 対象ファイルのパス
+
+        Raises:
+            zipfile.BadZipFile: ZIP形式として読み込めない場合
+            ValueError: XLSXとして必要なパーツが見つからない場合
+        """
+        self.file_path = file_path
+        self._zip = zipfile.ZipFile(file_path)
+
+        self._sheet_parts: Dict[str, str] = {}
+        self.sheet_names: List[str] = []
+        self._shared_strings_path: Optional[str] = None
+        self._styles_path: Optional[str] = None
+        self._epoch = WINDOWS_EPOCH
+
+        # 必要になるまで読み込まないデータ
+        self._shared_strings: Optional[Sequence[str]] = None
+        self._date_styles: Optional[Set[int]] = None
+        self._timedelta_styles: Optional[Set[int]] = None
+
+        try:
+            self._load_workbook_structure()
+        except Exception:
+            self._zip.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ZIPファイルを閉じる"""
+        self._zip.close()
+
+    def read_cells(self, cell_list: List[str], sheet_name: Optional[str] = None) -> List[Any]:
+        """指定されたセルの値を読み込む
+
+        Args:
+            cell_list: セル座標のリスト（例: ["A1", "B2"]）
+            sheet_name: シート名（指定しない場合は最初のシート）
+
+        Returns:
+            セル値のリスト（空セル・範囲外・不正な座標はNone）
+
+        Raises:
+            KeyError: 指定されたシートが存在しない場合
+        """
+        return self.read_positions(parse_cell_positions(cell_list), sheet_name)
+
+    def read_positions(
+        self, positions: List[CellPosition], sheet_name: Optional[str] = None
+    ) -> List[Any]:
+        """変換済みのセル位置の値を読み込む
+
+        Args:
+            positions: (row_index, col_index) のリスト（0-indexed、不正な座標は None）
+            sheet_name: シート名（指定しない場合は最初のシート）
+
+        Returns:
+            セル値のリスト（空セル・範囲外・不正な座標はNone）
+
+        Raises:
+            KeyError: 指定されたシートが存在しない場合
+        """
+        sheet_part = self._get_sheet_part(sheet_name)
+        values: List[Any] = [None] * len(positions)
+
+        # ファイル内の表記（"D1" 等）で直接照合できるよう、正規化した座標をキーにする
+        targets: Dict[str, List[int]] = {}
+        max_row = -1
+        for i, position in enumerate(positions):
+            if position is None:
+                continue
+            row, col = position
+            address = f"{get_column_letter(col + 1)}{row + 1}"
+            targets.setdefault(address, []).append(i)
+            max_row = max(max_row, row)
+
+        if not targets:
+            return values
+
+        remaining = len(targets)
+        row_index = -1
+        col_index = -1
+        last_address = None
+        # r属性が省略されたセル（行番号は行の終了時に確定する）: (列番号, 要素) のリスト
+        unaddressed_cells: List[Tuple[int, ET.Element]] = []
+
+        # Pythonに渡すイベント数を減らすため、要素の終了イベントのみを受け取る
+        with self._zip.open(sheet_part) as source:
+            for _, element in ET.iterparse(source):
+                tag = element.tag
+                if tag == _CELL_TAG:
+                    address = element.get("r")
+                    if address:
+                        last_address = address
+                    else:
+                        # r属性が省略されたセルは直前のセルの右隣とみなす
+                        # （列番号は必要になった時点で直前のセル座標から求める）
+                        if last_address is not None:
+                            col_index = parse_cell_address(last_address)[1]
+                            last_address = None
+                        col_index += 1
+                        unaddressed_cells.append((col_index, element))
+                        continue
+
+                    indexes = targets.get(address)
+                    if indexes:
+                        self._store_value(element, indexes, values)
+                        remaining -= 1
+                        if remaining == 0:
+                            break
+                    element.clear()
+
+                elif tag == _ROW_TAG:
+                    # r属性が省略された行は直前の行の次とみなす
+                    row_attr = element.get("r")
+                    row_index = int(row_attr) - 1 if row_attr else row_index + 1
+
+                    for col, cell in unaddressed_cells:
+                        indexes = targets.get(f"{get_column_letter(col + 1)}{row_index + 1}")
+                        if indexes:
+                            self._store_value(cell, indexes, values)
+                            remaining -= 1
+                    unaddressed_cells.clear()
+                    col_index = -1
+                    last_address = None
+                    element.clear()
+
+                    # 対象セルがすべて見つかるか、対象セルの最大行まで読んだら以降は読まない
+                    if remaining == 0 or row_index >= max_row:
+                        break
+
+        return values
+
+    def read_image_anchors(self, sheet_name: Optional[str] = None) -> Set[Tuple[int, int]]:
+        """シート内の画像のアンカー位置（開始セル）を読み込む
+
+        ワークシートのリレーションから描画パーツを探し、描画パーツのXMLだけを
+        ストリーミングで解析する。openpyxl の画像と同様に、セルに固定された
+        アンカー（oneCellAnchor, twoCellAnchor）の画像（<pic>）のみを対象とする。
+
+        Args:
+            sheet_name: シート名（指定しない場合は最初のシート）
+
+        Returns:
+            画像が配置されている (row_index, col_index) の集合（0-indexed）
+
+        Raises:
+            KeyError: 指定されたシートが存在しない場合
+        """
+        sheet_part = self._get_sheet_part(sheet_name)
+        anchors: Set[Tuple[int, int]] = set()
+
+        for _, rel_type, target in _read_relationships(self._zip, sheet_part):
+            if not rel_type.endswith(_REL_DRAWING):
+                continue
+            try:
+                source = self._zip.open(target)
+            except KeyError:
+                continue
+            with source:
+                for _, element in ET.iterparse(source):
+                    tag = element.tag
+                    if tag != _ONE_CELL_ANCHOR_TAG and tag != _TWO_CELL_ANCHOR_TAG:
+                        continue
+                    anchor_from = element.find(_ANCHOR_FROM_TAG)
+                    if anchor_from is not None and element.find(_PICTURE_TAG) is not None:
+                        anchors.add((
+                            int(anchor_from.findtext(_ANCHOR_ROW_TAG)),
+                            int(anchor_from.findtext(_ANCHOR_COL_TAG)),
+                        ))
+                    element.clear()
+
+        return anchors
+
+    def read_all_image_anchors(self) -> Dict[str, Set[Tuple[int, int]]]:
+        """全ワークシートの画像のアンカー位置を読み込む
+
+        Returns:
+            シート名 → 画像が配置されている (row_index, col_index) の集合の辞書
+            （ブック内のシート順）
+        """
+        return {name: self.read_image_anchors(name) for name in self.sheet_names}
+
+    def _store_value(self, element: ET.Element, indexes: List[int], values: List[Any]):
+        """セルの値を解析して結果リストの該当位置に格納
+
+        Args:
+            element: <c> 要素
+            indexes: 値を格納する結果リストの位置
+            values: 結果リスト
+        """
+        value = self._parse_cell_value(element)
+        for i in indexes:
+            values[i] = value
+
+    def _load_workbook_structure(self):
+        """ブック本体・シート・共有文字列・スタイルのパーツ位置を読み込む
+
+        Raises:
+            ValueError: ブック本体のパーツが見つからない場合
+        """
+        workbook_path = "xl/workbook.xml"
+        for _, rel_type, target in _read_relationships(self._zip, ""):
+            if rel_type.endswith(_REL_OFFICE_DOCUMENT):
+                workbook_path = target
+                break
+
+        try:
+            workbook_root = ET.fromstring(self._zip.read(workbook_path))
+        except KeyError:
+            raise ValueError(f"ブック本体が見つかりません: {workbook_path}")
+
+        # 1904年基準の日付システムの場合は日付変換の基準日を切り替える
+        workbook_pr = workbook_root.find(_WORKBOOK_PR_TAG)
+        if workbook_pr is not None and workbook_pr.get("date1904") in ("1", "true"):
+            self._epoch = CALENDAR_MAC_1904
+
+        worksheet_targets = {}
+        for rel_id, rel_type, target in _read_relationships(self._zip, workbook_path):
+            if rel_type.endswith(_REL_WORKSHEET):
+                worksheet_targets[rel_id] = target
+            elif rel_type.endswith(_REL_SHARED_STRINGS):
+                self._shared_strings_path = target
+            elif rel_type.endswith(_REL_STYLES):
+                self._styles_path = target
+
+        # ワークシートのみを対象にする（グラフシート等は openpyxl の worksheets と同様に除外）
+        for sheet in workbook_root.iter(_SHEET_TAG):
+            target = worksheet_targets.get(sheet.get(_REL_ID_ATTR))
+            if target is not None:
+                name = sheet.get("name", "")
+                self.sheet_names.append(name)
+                self._sheet_parts[name] = target
+
+    def _get_sheet_part(self, sheet_name: Optional[str]) -> str:
+        """シート名からワークシートのパーツのパスを取得
+
+        Args:
+            sheet_name: シート名（Noneの場合は最初のシート）
+
+        Returns:
+            ワークシートXMLのパス
+
+        Raises:
+            KeyError: シートが存在しない場合
+        """
+        if not sheet_name:
+            if not self.sheet_names:
+                raise KeyError("ワークシートが存在しません")
+            sheet_name = self.sheet_names[0]
+
+        if sheet_name not in self._sheet_parts:
+            raise KeyError(f"シートが見つかりません: {sheet_name}")
+
+        return self._sheet_parts[sheet_name]
+
+    def _parse_cell_value(self, element: ET.Element) -> Any:
+        """<c>要素からセル値を取り出す（openpyxl の data_only=True と同じ変換）
+
+        Args:
+            element: <c>要素
+
+        Returns:
+            セル値（値がない場合はNone）
+        """
+        data_type = element.get("t", "n")
+
+        if data_type == "inlineStr":
+            child = element.find(_INLINE_STRING_TAG)
+            return _text_content(child) if child is not None else None
+
+        value = element.findtext(_VALUE_TAG) or None
+        if value is None:
+            return None
+
+        if data_type == "n":
+            number = _cast_number(value)
+            style_id = int(element.get("s") or 0)
+            date_styles, timedelta_styles = self._get_date_styles()
+            if style_id in date_styles:
+                try:
+                    return from_excel(number, self._epoch, timedelta=style_id in timedelta_styles)
+                except (OverflowError, ValueError):
+                    # 日付として扱えない値はopenpyxlと同様にエラー値とする
+                    return "#VALUE!"
+            return number
+        if data_type == "s":
+            return self._get_shared_strings()[int(value)]
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return from_ISO8601(value)
+
+        # "str"（数式の文字列結果）と "e"（エラー値）はそのまま返す
+        return value
+
+    def _get_shared_strings(self) -> Sequence[str]:
+        """共有文字列テーブルを取得（初回のみ読み込む）
+
+        Returns:
+            共有文字列のシーケンス
+        """
+        if self._shared_strings is None:
+            if self._shared_strings_path is not None:
+                self._shared_strings = _parse_shared_strings(
+                    self._zip.read(self._shared_strings_path)
+                )
+            else:
+                self._shared_strings = ()
+
+        return self._shared_strings
+
+    def _get_date_styles(self) -> Tuple[Set[int], Set[int]]:
+        """日付・時間書式が設定されたセルスタイルの番号を取得（初回のみ読み込む）
+
+        Returns:
+            (日付書式のスタイル番号の集合, 経過時間書式のスタイル番号の集合)
+        """
+        if self._date_styles is None:
+            date_styles: Set[int] = set()
+            timedelta_styles: Set[int] = set()
+
+            if self._styles_path is not None:
+                root = ET.fromstring(self._zip.read(self._styles_path))
+                custom_formats = {
+                    int(num_fmt.get("numFmtId")): num_fmt.get("formatCode")
+                    for num_fmt in root.iter(_NUM_FMT_TAG)
+                }
+                cell_xfs = root.find(_CELL_XFS_TAG)
+                xfs = cell_xfs.iterfind(_XF_TAG) if cell_xfs is not None else ()
+                for style_id, xf in enumerate(xfs):
+                    num_fmt_id = int(xf.get("numFmtId") or 0)
+                    fmt = custom_formats.get(num_fmt_id) or builtin_format_code(num_fmt_id)
+                    if fmt is None:
+                        continue
+                    if is_date_format(fmt):
+                        date_styles.add(style_id)
+                    if is_timedelta_format(fmt):
+                        timedelta_styles.add(style_id)
+
+            self._date_styles = date_styles
+            self._timedelta_styles = timedelta_styles
+
+        return self._date_styles, self._timedelta_styles
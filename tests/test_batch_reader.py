@@ -0,0 +1,39 @@
+"""ファイル先読み機能のテスト"""
+from pathlib import Path
+from src.batch_reader import BatchReader
+
+
+class TestBatchReader:
+    """BatchReaderクラスのテスト"""
+
+    def test_先読み後もファイル内容は変わらない(self, tmp_path):
+        """先読みしたファイルを通常どおり読み込めることを確認"""
+        file_paths = []
+        for i in range(3):
+            file_path = tmp_path / f"file_{i}.xlsx"
+            file_path.write_bytes(bytes([i]) * 1024)
+            file_paths.append(file_path)
+
+        with BatchReader() as reader:
+            reader.prefetch(file_paths)
+
+        for i, file_path in enumerate(file_paths):
+            assert file_path.read_bytes() == bytes([i]) * 1024
+
+    def test_存在しないファイルでもエラーにならない(self, tmp_path):
+        """先読みはヒントのため、読めないファイルがあっても例外を送出しないことを確認"""
+        with BatchReader() as reader:
+            reader.prefetch([tmp_path / "missing.xlsx", Path(tmp_path)])
+
+    def test_スレッドプールでの先読み(self, tmp_path, monkeypatch):
+        """posix_fadvise がない環境ではスレッドプールで先読みすることを確認"""
+        monkeypatch.delattr("os.posix_fadvise", raising=False)
+        file_path = tmp_path / "file.csv"
+        file_path.write_text("a,b\n", encoding="utf-8")
+
+        reader = BatchReader(max_workers=2)
+        reader.prefetch([file_path, tmp_path / "missing.csv"])
+
+        assert reader._executor is not None
+        reader.close()
+        assert reader._executor is None
@@ -0,0 +1,47 @@
+"""セル座標変換機能のテスト"""
+import pytest
+from src.cell_address import group_positions_by_row, parse_cell_address, parse_cell_positions
+
+
+class TestParseCellAddress:
+    """parse_cell_address関数のテスト"""
+
+    def test_単一文字の列を変換できる(self):
+        """A1, B2などの座標を0-indexedの行列に変換できることを確認"""
+        assert parse_cell_address("A1") == (0, 0)
+        assert parse_cell_address("B2") == (1, 1)
+        assert parse_cell_address("Z10") == (9, 25)
+
+    def test_複数文字の列を変換できる(self):
+        """AA, AZ, BAなど複数文字の列を変換できることを確認"""
+        assert parse_cell_address("AA1") == (0, 26)
+        assert parse_cell_address("AZ3") == (2, 51)
+        assert parse_cell_address("BA1") == (0, 52)
+        assert parse_cell_address("XFD1048576") == (1048575, 16383)
+        assert parse_cell_address("ZZZ1") == (0, 18277)
+
+    def test_小文字の座標も変換できる(self):
+        """小文字で指定された座標も変換できることを確認"""
+        assert parse_cell_address("d1") == (0, 3)
+
+    @pytest.mark.parametrize("address", ["", "A", "1", "A1B", "Ａ1", "A１", "AAAA1"])
+    def test_不正な座標はエラー(self, address):
+        """不正な形式の座標の場合、ValueErrorが発生することを確認"""
+        with pytest.raises(ValueError) as exc_info:
+            parse_cell_address(address)
+
+        assert "不正なセル座標です" in str(exc_info.value)
+
+
+class TestParseCellPositions:
+    """parse_cell_positions・group_positions_by_row関数のテスト"""
+
+    def test_不正な座標はNoneに変換される(self):
+        """セル座標のリストを変換し、不正な座標はNoneになることを確認"""
+        assert parse_cell_positions(["A1", "bad", "C3"]) == [(0, 0), None, (2, 2)]
+
+    def test_行ごとにまとめられる(self):
+        """セル位置が行ごとに (列, 元の位置) でまとめられることを確認"""
+        positions = [(0, 1), None, (2, 0), (0, 3)]
+
+        assert group_positions_by_row(positions) == {0: [(1, 0), (3, 3)], 2: [(0, 2)]}
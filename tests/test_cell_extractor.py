@@ -1,7 +1,8 @@
 """セル値抽出機能のテスト"""
+import datetime
 import pytest
 from pathlib import Path
-from src.cell_extractor import CellExtractor
+from src.cell_extractor import CellExtractor, extract_cells
 
 
 class TestCellExtractor:
@@ -148,3 +149,42 @@ class TestCellExtractor:
         assert values[0] == "Sheet1_A1"
         assert values[1] == "Sheet1_B1"
         assert values[2] == "Sheet1_C1"
+
+    def test_BOM付きCSVからセル値を抽出できる(self, tmp_path):
+        """BOM付きUTF-8のCSVでも先頭セルの値が正しく抽出できることを確認"""
+        file_path = tmp_path / "bom.csv"
+        file_path.write_text("日付,値\n2024/01/01,0012\n", encoding="utf-8-sig")
+        extractor = CellExtractor(file_path)
+
+        values = extractor.extract_cells(["A1", "A2", "B2", "C5"])
+
+        # 値は文字列のまま返され、範囲外は空文字列になる
+        assert values == ["日付", "2024/01/01", "0012", ""]
+
+    def test_モジュール関数でセル値を抽出できる(self):
+        """extract_cells 関数でもクラス経由と同じ値が抽出できることを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "test_data.xlsx"
+        cells = ["A1", "B2", "C3"]
+
+        assert extract_cells(file_path, cells) == CellExtractor(file_path).extract_cells(cells)
+
+    def test_BIFF形式のxlsからセル値を抽出できる(self):
+        """BIFF形式の.xlsファイルから各データ型の値を抽出できることを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "legacy_data.xls"
+        extractor = CellExtractor(file_path)
+
+        values = extractor.extract_cells(["A1", "B1", "C1", "D1", "A2", "B2", "C3", "Z99", "bad"])
+
+        assert values == [
+            "プロジェクトA", 12, 1.5, datetime.datetime(2025, 1, 15), True, "", "C3_xls", "", ""
+        ]
+
+    def test_BIFF形式のxlsでシート名を指定できる(self):
+        """BIFF形式の.xlsファイルでシート名を指定して抽出できることを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "legacy_data.xls"
+        extractor = CellExtractor(file_path)
+
+        assert extractor.extract_cells(["A1"], sheet_name="Sheet2") == ["Sheet2_A1"]
+
+        with pytest.raises(RuntimeError):
+            extractor.extract_cells(["A1"], sheet_name="NoSheet")
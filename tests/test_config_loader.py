@@ -1,7 +1,7 @@
 """設定ファイル読み込み機能のテスト"""
 import pytest
 from pathlib import Path
-from src.config_loader import ConfigLoader
+from src.config_loader import ConfigLoader, _match_file_type_index
 
 
 class TestConfigLoader:
@@ -138,3 +138,84 @@ class TestConfigLoader:
             "プロジェクト名", "項目1", "項目2", "項目3", "承認日", "レビュアー", "備考"
         ]
         assert len(file_type_2["cell_labels"]) == len(file_type_2["target_cells"])
+
+    def test_cell_labelsの位置の辞書が作成される(self):
+        """各ファイルタイプにラベル → 位置の辞書が作成されることを確認"""
+        config_path = Path(__file__).parent / "fixtures" / "multi_file_type_config.ini"
+        loader = ConfigLoader(config_path)
+
+        for file_type in loader.file_types:
+            label_index = file_type["cell_label_index"]
+            assert label_index == {
+                label: file_type["cell_labels"].index(label)
+                for label in file_type["cell_labels"]
+            }
+        assert loader.file_types[1]["cell_label_index"]["承認日"] == 4
+
+    def test_複数パターンにマッチする場合は先に定義したファイルタイプを返す(self, tmp_path):
+        """パターンが重なる場合も設定ファイルの記述順で最初のファイルタイプが選ばれることを確認"""
+        config_path = tmp_path / "config.ini"
+        config_path.write_text(
+            "[SETTINGS]\n"
+            "target_dir = ./test_input\n"
+            "output_filename = out.txt\n"
+            "\n"
+            "[FILE_TYPE_1]\n"
+            "file_pattern = *報告*_v*.xlsx\n"
+            "target_sheet = sheet1\n"
+            "target_cells = A1\n"
+            "\n"
+            "[FILE_TYPE_2]\n"
+            "file_pattern = *.xlsx\n"
+            "target_sheet = sheet2\n"
+            "target_cells = B1\n",
+            encoding="utf-8"
+        )
+        loader = ConfigLoader(config_path)
+
+        assert loader.get_file_type_config("月次報告_v2.xlsx")["target_sheet"] == "sheet1"
+        assert loader.get_file_type_config("議事録.xlsx")["target_sheet"] == "sheet2"
+        assert loader.get_file_type_config("月次報告_v2.csv") is None
+
+    def test_設定値にパーセント記号を含めることができる(self, tmp_path):
+        """値の補間を行わず、"%" を含むパスやパターンをそのまま読み込めることを確認"""
+        config_path = tmp_path / "config.ini"
+        config_path.write_text(
+            "[SETTINGS]\n"
+            "target_dir = ./100%_input\n"
+            "output_filename = out.txt\n"
+            "\n"
+            "[FILE_TYPE_1]\n"
+            "file_pattern = 進捗100%*.xlsx\n"
+            "target_sheet = sheet1\n"
+            "target_cells = A1\n",
+            encoding="utf-8"
+        )
+        loader = ConfigLoader(config_path)
+
+        assert loader.target_dir == "./100%_input"
+        assert loader.get_file_type_config("進捗100%_報告.xlsx") is not None
+
+    def test_セル座標は読み込み時に変換される(self):
+        """対象セルが読み込み時に (row, col) に変換されることを確認"""
+        legacy = ConfigLoader(Path(__file__).parent / "fixtures" / "test_config.ini")
+        assert legacy.target_cell_positions == [(0, 0), (1, 1), (2, 2)]
+        assert legacy.image_check_cell_positions == [(0, 3), (1, 4)]
+
+        loader = ConfigLoader(Path(__file__).parent / "fixtures" / "multi_file_type_config.ini")
+        file_type = loader.file_types[1]
+        assert file_type["target_cell_positions"][0] == (1, 30)  # AE2
+        assert file_type["image_check_cell_positions"] == [(2, 76)]  # BY3
+
+    def test_同じファイル名の判定結果は再利用される(self):
+        """同じファイル名で繰り返し判定しても同じ設定が返り、2回目以降はキャッシュが使われることを確認"""
+        config_path = Path(__file__).parent / "fixtures" / "multi_file_type_config.ini"
+        loader = ConfigLoader(config_path)
+        filename = "キャッシュ確認_0_レビューチェックリスト.xlsx"
+
+        first = loader.get_file_type_config(filename)
+        hits_before = _match_file_type_index.cache_info().hits
+        second = loader.get_file_type_config(filename)
+
+        assert second is first
+        assert _match_file_type_index.cache_info().hits == hits_before + 1
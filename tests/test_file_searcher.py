@@ -1,7 +1,7 @@
 """ファイル探索機能のテスト"""
 import pytest
 from pathlib import Path
-from src.file_searcher import FileSearcher
+from src.file_searcher import FileSearcher, walk_files
 
 
 class TestFileSearcher:
@@ -85,3 +85,62 @@ class TestFileSearcher:
         assert isinstance(found_files, list)
         for file_path in found_files:
             assert isinstance(file_path, Path)
+
+    def test_walk_filesはサブディレクトリのファイルを列挙する(self, tmp_path):
+        """walk_files がディレクトリを除外し、サブディレクトリ内のファイルも列挙することを確認"""
+        (tmp_path / "sub" / "sub2").mkdir(parents=True)
+        (tmp_path / "a.xlsx").write_bytes(b"")
+        (tmp_path / "sub" / "sub2" / "b.csv").write_bytes(b"")
+
+        names = sorted(entry.name for entry in walk_files(tmp_path))
+
+        assert names == ["a.xlsx", "b.csv"]
+
+    def test_日本語キーワードで探索できる(self, tmp_path):
+        """日本語のキーワード・ディレクトリ名でもマッチしたファイルのPathが返ることを確認"""
+        sub_dir = tmp_path / "レビュー"
+        sub_dir.mkdir()
+        (sub_dir / "0_レビューチェックリスト.xlsx").write_bytes(b"")
+        (sub_dir / "0_レビューチェックリスト.txt").write_bytes(b"")
+        (sub_dir / "議事録.xlsx").write_bytes(b"")
+        searcher = FileSearcher(tmp_path, "チェックリスト")
+
+        found_files = searcher.search()
+
+        assert found_files == [sub_dir / "0_レビューチェックリスト.xlsx"]
+
+    def test_隠しディレクトリとロックファイルは探索しない(self, tmp_path):
+        """隠しディレクトリ・node_modules・Excelのロックファイル・隠しファイルが除外されることを確認"""
+        for sub_dir in (".git", "node_modules", "data"):
+            (tmp_path / sub_dir).mkdir()
+            (tmp_path / sub_dir / "日経平均.xlsx").write_bytes(b"")
+        (tmp_path / "data" / "~$日経平均.xlsx").write_bytes(b"")
+        (tmp_path / "data" / "._日経平均.xlsx").write_bytes(b"")
+        searcher = FileSearcher(tmp_path, "日経平均")
+
+        found_files = searcher.search()
+
+        assert found_files == [tmp_path / "data" / "日経平均.xlsx"]
+
+    def test_ロックファイルの接頭辞を持つディレクトリは探索しない(self, tmp_path):
+        """ロックファイルと同じ "~$" 始まりのディレクトリ配下が探索されないことを確認"""
+        for sub_dir in ("~$一時", "data"):
+            (tmp_path / sub_dir).mkdir()
+            (tmp_path / sub_dir / "日経平均.xlsx").write_bytes(b"")
+
+        for max_workers in (1, 4):
+            found = [entry.path for entry in walk_files(tmp_path, max_workers=max_workers)]
+            assert found == [str(tmp_path / "data" / "日経平均.xlsx")]
+
+    def test_並行走査と逐次走査で同じファイルが列挙される(self, tmp_path):
+        """スレッド数に関わらず同じファイルが列挙されることを確認"""
+        for i in range(5):
+            sub_dir = tmp_path / f"dir{i}" / "sub"
+            sub_dir.mkdir(parents=True)
+            (sub_dir / f"file{i}.xlsx").write_bytes(b"")
+
+        sequential = sorted(entry.path for entry in walk_files(tmp_path, max_workers=1))
+        parallel = sorted(entry.path for entry in walk_files(tmp_path, max_workers=4))
+
+        assert len(sequential) == 5
+        assert parallel == sequential
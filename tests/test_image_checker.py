@@ -1,7 +1,7 @@
 """画像判定機能のテスト"""
 import pytest
 from pathlib import Path
-from src.image_checker import ImageChecker
+from src.image_checker import ImageChecker, _load_image_anchors, check_images
 
 
 class TestImageChecker:
@@ -75,6 +75,13 @@ class TestImageChecker:
         assert results[0] == "-"  # .xlsは画像判定非対応
         assert results[1] == "-"  # .xlsは画像判定非対応
 
+    def test_xlsx以外はファイルを開かずに非対応マークを返す(self):
+        """.xlsx以外の拡張子は拡張子だけで判定し、ファイルを読み込まないことを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "non_existent.csv"
+        checker = ImageChecker(file_path, validate=False)
+
+        assert checker.check_images(["D1", "E1"]) == ["-", "-"]
+
     def test_存在しないファイルの場合はエラー(self):
         """存在しないファイルを指定した場合、エラーが発生することを確認"""
         file_path = Path(__file__).parent / "fixtures" / "non_existent.xlsx"
@@ -126,3 +133,66 @@ class TestImageChecker:
 
         # Sheet1には画像がないので×
         assert results[0] == "×"
+
+    def test_開いている軽量リーダーを共有して画像判定できる(self):
+        """呼び出し元で開いた XlsxReader を渡して画像判定できることを確認"""
+        from src.cell_extractor import CellExtractor
+        from src.xlsx_reader import XlsxReader
+
+        file_path = Path(__file__).parent / "fixtures" / "excel_partial_images.xlsx"
+        with XlsxReader(file_path) as reader:
+            checker = ImageChecker(file_path, reader=reader)
+            assert checker.check_images(["D1", "E1"]) == ["○", "×"]
+
+            # 同じリーダーをセル値抽出にも利用できる
+            extractor = CellExtractor(file_path, reader=reader)
+            assert len(extractor.extract_cells(["A1"])) == 1
+
+    def test_モジュール関数で画像を判定できる(self):
+        """check_images 関数でもクラス経由と同じ判定結果になることを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "excel_with_images.xlsx"
+        cells = ["D1", "E1", "F1"]
+
+        assert check_images(file_path, cells) == ImageChecker(file_path).check_images(cells)
+
+    def test_同じファイルの画像判定は解析結果を再利用する(self, tmp_path):
+        """同じファイルは再解析せず、更新されたファイルは読み直すことを確認"""
+        import shutil
+
+        file_path = tmp_path / "target.xlsx"
+        shutil.copy(Path(__file__).parent / "fixtures" / "excel_with_images.xlsx", file_path)
+        _load_image_anchors.cache_clear()
+
+        assert ImageChecker(file_path).check_images(["D1", "E1"]) == ["○", "○"]
+        assert ImageChecker(file_path).check_images(["D1", "E1"]) == ["○", "○"]
+        assert _load_image_anchors.cache_info().misses == 1
+
+        shutil.copy(Path(__file__).parent / "fixtures" / "excel_partial_images.xlsx", file_path)
+        assert ImageChecker(file_path).check_images(["D1", "E1"]) == ["○", "×"]
+        assert _load_image_anchors.cache_info().misses == 2
+
+    def test_複数シートの画像判定はブックを1回だけ解析する(self):
+        """別のシートを指定した判定でも、1回目に全シート分をまとめて読み込んでいることを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "multi_sheet_with_images.xlsx"
+        _load_image_anchors.cache_clear()
+
+        assert ImageChecker(file_path).check_images(["D1"], sheet_name="Sheet1") == ["×"]
+        assert ImageChecker(file_path).check_images(["D1"], sheet_name="Sheet2") == ["○"]
+        assert ImageChecker(file_path).check_images(["D1"]) == ["×"]
+        assert _load_image_anchors.cache_info().misses == 1
+
+    def test_同じインスタンスでの再判定はファイルを確認しない(self, monkeypatch):
+        """2回目以降の判定は読み込み済みのアンカー位置を使い、stat も行わないことを確認"""
+        import os
+
+        file_path = Path(__file__).parent / "fixtures" / "multi_sheet_with_images.xlsx"
+        checker = ImageChecker(file_path)
+        assert checker.check_images(["D1"]) == ["×"]
+        assert checker.check_images(["D1"], sheet_name="Sheet2") == ["○"]
+
+        def fail_stat(*args, **kwargs):
+            raise AssertionError("stat should not be called")
+
+        monkeypatch.setattr(os, "stat", fail_stat)
+        assert checker.check_images(["D1", "E1"]) == ["×", "×"]
+        assert checker.check_images(["D1"], sheet_name="Sheet2") == ["○"]
@@ -3,7 +3,14 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
-from src.main import ExcelFileChecker
+import logging
+import csv
+import io
+import openpyxl
+from src.main import (
+    ExcelFileChecker, _BufferedStdoutHandler, _extract_file, _process_file_with_config_worker
+)
+from src.xlsx_reader import XlsxReader
 
 
 class TestExcelFileChecker:
@@ -106,6 +113,21 @@ output_filename = test_result.txt
         assert "探索開始" in output or "発見" in output
         assert "処理完了" in output
 
+    def test_ファイルごとのログはDEBUGレベルの場合のみ出力される(self, test_config_dir, capsys):
+        """既定ではファイルごとのログを出力せず、DEBUGレベルでは出力することを確認"""
+        config_path = test_config_dir / "test_config.ini"
+
+        ExcelFileChecker(config_path, use_cache=False).run()
+        assert "処理: " not in capsys.readouterr().out
+
+        main_logger = logging.getLogger("src.main")
+        main_logger.setLevel(logging.DEBUG)
+        try:
+            ExcelFileChecker(config_path, use_cache=False).run()
+        finally:
+            main_logger.setLevel(logging.INFO)
+        assert "[DEBUG] 処理: " in capsys.readouterr().out
+
     def test_存在しないconfig_iniの場合はエラー(self):
         """存在しないconfig.iniを指定した場合、エラーが発生することを確認"""
         config_path = Path("/non/existent/config.ini")
@@ -279,3 +301,282 @@ image_check_cells = D1
 
         # ヘッダー行が存在することを確認
         assert len(lines) > 0
+
+    def test_キャッシュが作成され再実行時に利用される(self, test_config_dir):
+        """実行後にキャッシュが作成され、再実行しても同じ結果になることを確認"""
+        config_path = test_config_dir / "test_config.ini"
+        output_path = test_config_dir / "test_result.txt"
+
+        ExcelFileChecker(config_path).run()
+        first = output_path.read_text(encoding="utf-8")
+
+        assert any((test_config_dir / ".cache").iterdir())
+
+        ExcelFileChecker(config_path).run()
+        assert output_path.read_text(encoding="utf-8") == first
+
+    def test_キャッシュを無効にできる(self, test_config_dir):
+        """use_cache=Falseの場合、キャッシュが作成されないことを確認"""
+        config_path = test_config_dir / "test_config.ini"
+
+        ExcelFileChecker(config_path, use_cache=False).run()
+
+        assert not (test_config_dir / ".cache").exists()
+
+    def test_並列処理と逐次処理で同じ結果になる(self, test_config_dir):
+        """並列数を変えても出力内容が変わらないことを確認"""
+        config_path = test_config_dir / "test_config.ini"
+        output_path = test_config_dir / "test_result.txt"
+
+        ExcelFileChecker(config_path, use_cache=False, max_workers=1).run()
+        sequential = output_path.read_text(encoding="utf-8")
+
+        ExcelFileChecker(config_path, use_cache=False, max_workers=2).run()
+        parallel = output_path.read_text(encoding="utf-8")
+
+        assert parallel == sequential
+
+    def test_複数ファイルタイプ設定でも並列処理と逐次処理で同じ結果になる(self, multi_file_type_config_dir):
+        """新形式の設定でも並列数を変えて出力内容が変わらないことを確認"""
+        config_path = multi_file_type_config_dir / "test_config.ini"
+        output_path = multi_file_type_config_dir / "test_result.txt"
+
+        ExcelFileChecker(config_path, use_cache=False, max_workers=1).run()
+        sequential = output_path.read_text(encoding="utf-8")
+
+        ExcelFileChecker(config_path, use_cache=False, max_workers=2).run()
+        parallel = output_path.read_text(encoding="utf-8")
+
+        assert parallel == sequential
+
+    def test_batch_sizeを変えても同じ結果になる(self, multi_file_type_config_dir):
+        """出力の書き出し単位を変えても出力内容が変わらないことを確認"""
+        config_path = multi_file_type_config_dir / "test_config.ini"
+        output_path = multi_file_type_config_dir / "test_result.txt"
+
+        ExcelFileChecker(config_path, use_cache=False).run()
+        default = output_path.read_text(encoding="utf-8")
+
+        ExcelFileChecker(config_path, use_cache=False, batch_size=1).run()
+        assert output_path.read_text(encoding="utf-8") == default
+        assert "【サマリ】" in default
+
+    def test_サマリの件数が行の出力と同時に集計される(self, multi_file_type_config_dir):
+        """検証結果の行と一緒にサマリの各件数が正しく出力されることを確認"""
+        checker = ExcelFileChecker(multi_file_type_config_dir / "test_config.ini")
+        validation_results = [
+            {
+                "project_name": "A",
+                "checklist": {"filename": "a.xlsx"},
+                "record": {"filename": "b.xlsx"},
+                "validation": {"has_pair": True, "has_stamp": False, "status": "一致"}
+            },
+            {
+                "project_name": "B",
+                "checklist": {"filename": "c.xlsx"},
+                "record": None,
+                "validation": {"has_pair": False, "status": "-"}
+            },
+            {
+                "project_name": "C",
+                "checklist": None,
+                "record": {"filename": "d.xlsx"},
+                "validation": {"has_pair": False, "has_stamp": True, "status": "-"}
+            }
+        ]
+
+        content = checker._format_validation_results(validation_results, multi_file_type_config_dir)
+
+        assert len(content.split("\n\n")[0].split("\n")) == 5
+        assert content.endswith(
+            "【サマリ】\n"
+            "- プロジェクト総数: 3件\n"
+            "- 完全なペア: 1件\n"
+            "- チェックリストのみ: 1件\n"
+            "- 記録表のみ: 1件\n"
+            "- 捺印なし: 1件"
+        )
+
+    def test_検証結果のPath列はルートからの相対ディレクトリになる(self, multi_file_type_config_dir):
+        """ルート直下は "."、サブディレクトリは相対パス、ルート外は "." になることを確認"""
+        checker = ExcelFileChecker(multi_file_type_config_dir / "test_config.ini")
+        root_dir = checker.target_dir
+        validation = {"has_pair": False, "status": "-"}
+        validation_results = [
+            {"project_name": name, "checklist": {"filename": path.name, "file_path": path},
+             "record": None, "validation": validation}
+            for name, path in [
+                ("A", root_dir / "a.xlsx"),
+                ("B", root_dir / "sub" / "深い" / "b.xlsx"),
+                ("C", Path("/elsewhere/c.xlsx"))
+            ]
+        ]
+
+        content = checker._format_validation_results(validation_results, root_dir)
+        rows = content.split("\n\n")[0].split("\n")[1:]
+
+        assert [row.split("\t")[2] for row in rows] == [
+            ".", str(Path("sub") / "深い"), "."
+        ]
+
+    def test_ファイル名からファイルタイプを判定できる(self, multi_file_type_config_dir):
+        """ファイル名のキーワードからチェックリスト・記録表を判定できることを確認"""
+        checker = ExcelFileChecker(multi_file_type_config_dir / "test_config.ini")
+
+        assert checker._determine_file_type("A_レビューチェックリスト.xlsx") == "checklist"
+        assert checker._determine_file_type("Design_CheckList_v2.xlsx") == "checklist"
+        assert checker._determine_file_type("レビュー記録表_2024.xlsx") == "record"
+        assert checker._determine_file_type("社内記録表.xlsx") == "record"
+        # 両方を含む場合はチェックリストを優先する
+        assert checker._determine_file_type("記録表_checklist.xlsx") == "checklist"
+        assert checker._determine_file_type("other_file.xlsx") is None
+
+    def test_タブや改行を含む値はクォートして出力される(self, multi_file_type_config_dir):
+        """セル値にタブや改行が含まれても行・列がずれないことを確認"""
+        checker = ExcelFileChecker(multi_file_type_config_dir / "test_config.ini")
+        validation_results = [
+            {
+                "project_name": "A\tB",
+                "checklist": {
+                    "filename": "a.xlsx",
+                    "cell_labels": ["日付", "担当者"],
+                    "cell_values": ["2025-01-15", "山田\n太郎"]
+                },
+                "record": None,
+                "validation": {"has_pair": False, "status": "-"}
+            }
+        ]
+
+        content = checker._format_validation_results(validation_results, checker.target_dir)
+        rows = list(csv.reader(io.StringIO(content.split("\n\n")[0]), dialect="excel-tab"))
+
+        assert rows[1][:6] == ["a.xlsx", "チェックリスト", ".", "A\tB", "2025-01-15", "山田\n太郎"]
+
+    def test_プロセスプールはrunをまたいで再利用される(self, multi_file_type_config_dir):
+        """2回目の run では起動済みのプロセスプールを使い、close で停止することを確認"""
+        config_path = multi_file_type_config_dir / "test_config.ini"
+        output_path = multi_file_type_config_dir / "test_result.txt"
+
+        with ExcelFileChecker(config_path, use_cache=False, max_workers=2) as checker:
+            checker.run()
+            executor = checker._executor
+            assert executor is not None
+            first = output_path.read_text(encoding="utf-8")
+
+            checker.run()
+            assert checker._executor is executor
+            assert output_path.read_text(encoding="utf-8") == first
+
+        assert checker._executor is None
+
+    def test_with文を使わない場合はrunの終了時にプロセスプールを停止する(self, multi_file_type_config_dir):
+        """with 文の外で run を呼び出した場合、ワーカープロセスを残さないことを確認"""
+        checker = ExcelFileChecker(
+            multi_file_type_config_dir / "test_config.ini", use_cache=False, max_workers=2
+        )
+        checker.run()
+
+        assert checker._executor is None
+
+    def test_複数ファイルタイプの結果はヘッダーを1回だけ出力する(self, multi_file_type_config_dir):
+        """ヘッダー行は先頭に1回だけ出力され、各ファイルのデータ行が続くことを確認"""
+        checker = ExcelFileChecker(multi_file_type_config_dir / "test_config.ini")
+        root_dir = checker.target_dir
+        file_paths = [root_dir / "a.xlsx", root_dir / "sub" / "b.xlsx"]
+        results = [
+            {"filename": "a.xlsx", "cell_values": ["x", None], "image_results": ["○"],
+             "target_cells": ["A1", "B1"], "image_check_cells": ["D1"]},
+            {"filename": "b.xlsx", "cell_values": [1, 2], "image_results": ["×"],
+             "target_cells": ["A1", "B1"], "image_check_cells": ["D1"]}
+        ]
+
+        content = checker._format_multi_file_type_results(results, root_dir, file_paths)
+
+        assert content.split("\n") == [
+            "Filename\tPath\tA1\tB1\tD1(画像)",
+            "a.xlsx\t.\tx\t\t○",
+            "b.xlsx\tsub\t1\t2\t×"
+        ]
+
+    def test_ファイルタイプごとにまとめて処理しても元の順序で結果が返る(self, multi_file_type_config_dir):
+        """ファイルタイプが交互に並んでいても、グループ単位の処理結果が元の順序に戻ることを確認"""
+        input_dir = multi_file_type_config_dir / "input"
+        checklist = input_dir / "test_レビューチェックリスト_v1.xlsx"
+        record = input_dir / "レビュー記録表_2024.xlsx"
+        file_paths = [checklist, record, checklist, record, checklist]
+
+        for max_workers in (1, 2):
+            checker = ExcelFileChecker(
+                multi_file_type_config_dir / "test_config.ini", use_cache=False, max_workers=max_workers
+            )
+            configs = [checker.config.get_file_type_config(path.name) for path in file_paths]
+            with checker:
+                outcomes = checker._map_file_groups(file_paths, configs)
+
+            assert outcomes == [
+                _process_file_with_config_worker(path, config)
+                for path, config in zip(file_paths, configs)
+            ]
+
+    def test_複数ファイルタイプ設定でもキャッシュが利用される(self, multi_file_type_config_dir):
+        """新形式の設定でもキャッシュが作成され、再実行しても同じ結果になることを確認"""
+        config_path = multi_file_type_config_dir / "test_config.ini"
+        output_path = multi_file_type_config_dir / "test_result.txt"
+
+        ExcelFileChecker(config_path).run()
+        first = output_path.read_text(encoding="utf-8")
+
+        cache_files = list((multi_file_type_config_dir / ".cache").iterdir())
+        assert len(cache_files) == 2
+
+        ExcelFileChecker(config_path).run()
+        assert output_path.read_text(encoding="utf-8") == first
+
+    def test_画像判定がある場合もブックを1回だけ開く(self, monkeypatch):
+        """openpyxlのワークブックを構築せず、軽量リーダーを1回だけ開いて共有することを確認"""
+        file_path = Path(__file__).parent / "fixtures" / "excel_with_images.xlsx"
+        load_calls = []
+        original_load_workbook = openpyxl.load_workbook
+
+        def counting_load_workbook(*args, **kwargs):
+            load_calls.append(args)
+            return original_load_workbook(*args, **kwargs)
+
+        monkeypatch.setattr(openpyxl, "load_workbook", counting_load_workbook)
+
+        reader_opens = []
+        original_reader_init = XlsxReader.__init__
+
+        def counting_reader_init(self, *args, **kwargs):
+            reader_opens.append(args)
+            original_reader_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(XlsxReader, "__init__", counting_reader_init)
+
+        cell_values, image_results = _extract_file(file_path, ["A1"], ["D1", "E1"], None)
+
+        assert load_calls == []
+        assert len(reader_opens) == 1
+        assert image_results == ["○", "○"]
+        assert cell_values == _extract_file(file_path, ["A1"], [], None)[0]
+
+    def test_ログはまとめて標準出力に書き込まれる(self, capsys):
+        """ログは flush までバッファされ、上限件数に達すると書き込まれることを確認"""
+        handler = _BufferedStdoutHandler(capacity=3)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        test_logger = logging.getLogger("test_buffered_stdout")
+        test_logger.propagate = False
+        test_logger.addHandler(handler)
+        try:
+            test_logger.warning("1件目")
+            test_logger.warning("2件目")
+            assert capsys.readouterr().out == ""
+
+            test_logger.warning("3件目")
+            assert capsys.readouterr().out == "[WARNING] 1件目\n[WARNING] 2件目\n[WARNING] 3件目\n"
+
+            test_logger.error("4件目")
+            handler.flush()
+            assert capsys.readouterr().out == "[ERROR] 4件目\n"
+        finally:
+            test_logger.removeHandler(handler)
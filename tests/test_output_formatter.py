@@ -1,7 +1,8 @@
 """出力整形機能のテスト"""
+import io
 import pytest
 from pathlib import Path
-from src.output_formatter import OutputFormatter
+from src.output_formatter import OutputFormatter, _string_width
 
 
 class TestOutputFormatter:
@@ -328,3 +329,139 @@ class TestOutputFormatter:
 
         # サマリは含まれない
         assert "=== サマリ ===" not in formatted
+
+    def test_ストリームへの書き込みは文字列出力と一致する(self, tmp_path):
+        """write_results でファイルに書き込んだ内容が format_results の結果と一致することを確認"""
+        formatter = OutputFormatter(
+            target_cells=["A1", "B1"],
+            image_check_cells=["D1"]
+        )
+        root_dir = tmp_path
+        file_paths = [tmp_path / "sub" / "テスト.xlsx"]
+        results = [
+            {
+                "filename": "テスト.xlsx",
+                "cell_values": ["値", 12.5],
+                "image_results": ["○"]
+            }
+        ]
+
+        output_path = tmp_path / "output.txt"
+        with output_path.open("w", encoding="utf-8") as stream:
+            formatter.write_results(stream, results, root_dir=root_dir, file_paths=file_paths)
+
+        expected = formatter.format_results(results, root_dir=root_dir, file_paths=file_paths)
+        assert output_path.read_text(encoding="utf-8") == expected
+
+    def test_batch_sizeの行数ごとにflushされる(self):
+        """batch_size を指定すると、その行数ごとにストリームが flush されることを確認"""
+
+        class CountingStream(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.flush_count = 0
+
+            def flush(self):
+                self.flush_count += 1
+                super().flush()
+
+        formatter = OutputFormatter(target_cells=["A1"], image_check_cells=[])
+        results = [
+            {"filename": f"file{i}.xlsx", "cell_values": [i], "image_results": []}
+            for i in range(5)
+        ]
+
+        stream = CountingStream()
+        formatter.write_results(stream, results, batch_size=2)
+
+        assert stream.flush_count == 2
+        assert stream.getvalue() == formatter.format_results(results)
+
+    def test_表示幅は全角2半角1で計算されキャッシュされる(self):
+        """表示幅の計算結果が正しく、同じ文字列の再計算はキャッシュから返ることを確認"""
+        formatter = OutputFormatter(target_cells=["A1"], image_check_cells=[])
+
+        assert formatter._display_width("abc") == 3
+        assert formatter._display_width("日経平均_v1") == 11
+        assert formatter._display_width("ｱｲｳ") == 3
+        assert formatter._display_width("") == 0
+        # BMP 外の文字（絵文字）も全角として扱う
+        assert formatter._display_width("済😀") == 4
+
+        hits = _string_width.cache_info().hits
+        formatter._display_width("日経平均_v1")
+        assert _string_width.cache_info().hits == hits + 1
+
+    def test_列ごとに最大幅までパディングできる(self):
+        """列単位で最大幅を求めて揃え、列数が不足する行は空文字列で補うことを確認"""
+        formatter = OutputFormatter(target_cells=["A1", "B1"], image_check_cells=[])
+
+        # ヘッダーの幅（Filename=8, A1=2, B1=2）が下限になる
+        widths, columns = formatter._pad_columns([["a.xlsx", "テスト", "x"], ["b.csv", "1"]])
+
+        assert widths == [8, 6, 2]
+        assert columns == [
+            ["a.xlsx  ", "b.csv   "],
+            ["テスト", "1     "],
+            ["x ", "  "],
+        ]
+
+        # 列幅が空白文字列の表の範囲を超える列も表示幅で揃う
+        long_value = "x" * 300
+        widths, columns = formatter._pad_columns([[long_value, "", ""], ["日本語", "", ""]])
+        assert widths[0] == 300
+        assert columns[0] == [long_value, "日本語" + " " * 294]
+
+    def test_ヘッダーより列数が少ない行も整形できる(self):
+        """セル値・画像判定結果がヘッダーの列数より少ない場合も、空文字列で補って出力できることを確認"""
+        formatter = OutputFormatter(target_cells=["A1", "B1", "C1"], image_check_cells=["D1"])
+
+        output = formatter.format_results([
+            {"filename": "a.xlsx", "cell_values": ["x"], "image_results": []}
+        ])
+
+        assert output.split("\n") == [
+            "Filename, A1, B1, C1, D1(画像)",
+            "a.xlsx  , x ,   ,   ,         ",
+            ""
+        ]
+
+    def test_ツリーはルートからの相対パスで階層化される(self):
+        """ルート配下のファイルがディレクトリごとに名前順で階層化されることを確認"""
+        formatter = OutputFormatter(target_cells=["A1"], image_check_cells=[])
+        file_paths = [
+            Path("/data/sub/b.xlsx"),
+            Path("/data/c.xlsx"),
+            Path("/data/sub/deep/a.xlsx"),
+        ]
+
+        assert formatter._generate_tree(Path("/data"), file_paths) == [
+            "/data/",
+            "├── c.xlsx",
+            "└── sub/",
+            "    ├── b.xlsx",
+            "    └── deep/",
+            "        └── a.xlsx",
+        ]
+
+    def test_整形後の列の開始位置を取得できる(self):
+        """last_column_offsets が各行の列の開始位置（表示幅換算）と一致することを確認"""
+        formatter = OutputFormatter(target_cells=["A1"], image_check_cells=["D1"])
+        results = [
+            {"filename": "テスト.xlsx", "cell_values": ["値"], "image_results": ["○"]},
+            {"filename": "b.xlsx", "cell_values": [12345], "image_results": ["×"]},
+        ]
+
+        formatted = formatter.format_results(results)
+
+        offsets = formatter.last_column_offsets
+        assert offsets == [0, 13, 20]
+        for line in formatted.splitlines():
+            columns = line.split(", ")
+            starts = [0]
+            for column in columns[:-1]:
+                starts.append(starts[-1] + formatter._display_width(column) + 2)
+            assert starts == offsets
+
+        formatter.format_results([])
+        assert formatter.last_column_offsets == []
@@ -0,0 +1,87 @@
+"""抽出結果キャッシュ機能のテスト"""
+import os
+import pytest
+from pathlib import Path
+from src.result_cache import ResultCache
+
+
+class TestResultCache:
+    """ResultCacheクラスのテスト"""
+
+    @pytest.fixture
+    def target_file(self, tmp_path):
+        """キャッシュ対象のファイルを作成"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("a,b,c\n", encoding="utf-8")
+        return file_path
+
+    def test_保存した結果を取得できる(self, tmp_path, target_file):
+        """保存した結果がそのまま取得できることを確認"""
+        cache = ResultCache(tmp_path / ".cache")
+        result = {"filename": "data.csv", "cell_values": ["a"], "image_results": ["-"]}
+
+        cache.put(target_file, "sig", result)
+
+        assert cache.get(target_file, "sig") == result
+
+    def test_未保存の場合はNoneを返す(self, tmp_path, target_file):
+        """キャッシュが存在しない場合、Noneを返すことを確認"""
+        cache = ResultCache(tmp_path / ".cache")
+
+        assert cache.get(target_file, "sig") is None
+
+    def test_抽出設定が変わるとキャッシュを使わない(self, tmp_path, target_file):
+        """抽出設定（シグネチャ）が異なる場合、キャッシュが参照されないことを確認"""
+        cache = ResultCache(tmp_path / ".cache")
+        cache.put(target_file, "sig1", {"filename": "data.csv"})
+
+        assert cache.get(target_file, "sig2") is None
+
+    def test_ファイルが更新されるとキャッシュを使わない(self, tmp_path, target_file):
+        """ファイルの更新日時が変わった場合、キャッシュが参照されないことを確認"""
+        cache = ResultCache(tmp_path / ".cache")
+        cache.put(target_file, "sig", {"filename": "data.csv"})
+
+        stat = target_file.stat()
+        os.utime(target_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get(target_file, "sig") is None
+
+    def test_キャッシュの版が変わるとキャッシュを使わない(self, tmp_path, target_file, monkeypatch):
+        """抽出結果の形式を変えて版を上げた場合、以前のキャッシュが参照されないことを確認"""
+        cache = ResultCache(tmp_path / ".cache")
+        cache.put(target_file, "sig", {"filename": "data.csv"})
+
+        monkeypatch.setattr(ResultCache, "CACHE_VERSION", ResultCache.CACHE_VERSION + 1)
+
+        assert cache.get(target_file, "sig") is None
+
+    def test_壊れたキャッシュは削除してNoneを返す(self, tmp_path, target_file):
+        """読み込めないキャッシュはキャッシュなしとして扱い、ファイルを削除することを確認"""
+        cache = ResultCache(tmp_path / ".cache")
+        cache.put(target_file, "sig", {"filename": "data.csv"})
+        cache_files = list((tmp_path / ".cache").iterdir())
+        cache_files[0].write_bytes(b"broken")
+
+        assert cache.get(target_file, "sig") is None
+        assert not cache_files[0].exists()
+
+    def test_参照されていない古いキャッシュを削除できる(self, tmp_path, target_file):
+        """一定期間参照されていないキャッシュのみ削除され、参照したキャッシュは残ることを確認"""
+        other_file = tmp_path / "other.csv"
+        other_file.write_text("x\n", encoding="utf-8")
+        cache = ResultCache(tmp_path / ".cache")
+        cache.put(target_file, "sig", {"filename": "data.csv"})
+        cache.put(other_file, "sig", {"filename": "other.csv"})
+
+        # 全キャッシュを古くしてから、一方だけ参照する
+        old = 1_000_000_000
+        for cache_file in (tmp_path / ".cache").iterdir():
+            os.utime(cache_file, (old, old))
+        assert cache.get(target_file, "sig") == {"filename": "data.csv"}
+
+        cache.prune()
+
+        assert len(list((tmp_path / ".cache").iterdir())) == 1
+        assert cache.get(target_file, "sig") == {"filename": "data.csv"}
+        assert cache.get(other_file, "sig") is None
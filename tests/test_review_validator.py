@@ -0,0 +1,145 @@
+"""レビュー文書のペアリング・検証機能のテスト"""
+import pytest
+from src.review_validator import ReviewPair, ReviewValidator, get_label_index
+
+
+def _checklist(project_name="プロジェクトA", date="2025-01-15", reviewer="山田太郎"):
+    """テスト用のチェックリストのファイルデータを作成"""
+    return {
+        "filename": f"{project_name}_レビューチェックリスト.xlsx",
+        "cell_labels": ["プロジェクト名", "日付", "担当者"],
+        "cell_values": [project_name, date, reviewer],
+        "image_results": []
+    }
+
+
+def _record(project_name="プロジェクトA", date="承認日: 2025-01-15",
+            reviewer="レビュアー: 山田太郎", stamp="○"):
+    """テスト用の記録表のファイルデータを作成"""
+    return {
+        "filename": f"{project_name}_レビュー記録表.xlsx",
+        "cell_labels": ["プロジェクト名", "承認日", "レビュアー"],
+        "cell_values": [project_name, date, reviewer],
+        "image_results": [stamp]
+    }
+
+
+class TestReviewPair:
+    """ReviewPairクラスのテスト"""
+
+    def test_両方揃って一致する場合はOK(self):
+        """日付・担当者・捺印が揃っている場合にOKとなることを確認"""
+        pair = ReviewPair("プロジェクトA")
+        pair.set_checklist(_checklist())
+        pair.set_record(_record())
+
+        validation = pair.validate()
+
+        assert validation["has_pair"] is True
+        assert validation["status"] == "✓ OK"
+        assert validation["warnings"] == []
+
+    def test_記録表の値はコロン以降と比較される(self):
+        """「承認日: 」「レビュアー: 」の接頭辞の有無に関わらず比較できることを確認"""
+        for date, reviewer in [
+            ("承認日: 2025-01-15", "レビュアー: 山田太郎"),
+            ("2025-01-15", "山田太郎")
+        ]:
+            pair = ReviewPair("プロジェクトA")
+            pair.set_checklist(_checklist())
+            pair.set_record(_record(date=date, reviewer=reviewer))
+
+            validation = pair.validate()
+            assert validation["date_match"] is True
+            assert validation["reviewer_match"] is True
+
+    def test_どちらも設定されていない場合は両方なしとなる(self):
+        """チェックリスト・記録表のどちらもない場合は一致判定を行わないことを確認"""
+        pair = ReviewPair("プロジェクトA")
+
+        validation = pair.validate()
+
+        assert validation["has_pair"] is False
+        assert validation["date_match"] is None
+        assert validation["has_stamp"] is None
+        assert validation["status"] == "⚠️ 両方なし"
+
+    def test_検証結果は再設定されるまでキャッシュされる(self):
+        """validate を繰り返し呼んでも同じ結果を返し、ファイル再設定後は再検証されることを確認"""
+        pair = ReviewPair("プロジェクトA")
+        pair.set_checklist(_checklist())
+        pair.set_record(_record(stamp="×"))
+
+        first = pair.validate()
+        cached = pair._cached_validation
+        assert pair.validate() == first
+        assert pair._cached_validation is cached
+        assert first["has_stamp"] is False
+
+        pair.set_record(_record(stamp="○"))
+        assert pair.validate()["status"] == "✓ OK"
+
+    def test_属性へ直接代入しても再検証される(self):
+        """checklist・record に直接代入した場合もキャッシュを使わずに再検証されることを確認"""
+        pair = ReviewPair("プロジェクトA")
+        pair.set_checklist(_checklist())
+        assert pair.validate()["status"] == "⚠️ 記録表なし"
+
+        pair.record = _record()
+        assert pair.validate()["status"] == "✓ OK"
+
+        pair.checklist = None
+        assert pair.validate()["status"] == "⚠️ チェックリストなし"
+
+    def test_検証結果を変更してもキャッシュに影響しない(self):
+        """返された検証結果の警告リストを変更しても、以降の validate の結果が変わらないことを確認"""
+        pair = ReviewPair("プロジェクトA")
+        pair.set_checklist(_checklist())
+
+        pair.validate()["warnings"].append("追加の警告")
+
+        assert pair.validate()["warnings"] == ["レビュー記録表が見つかりません"]
+
+
+class TestReviewValidator:
+    """ReviewValidatorクラスのテスト"""
+
+    def test_プロジェクト名でペアリングされる(self):
+        """同じプロジェクト名のチェックリストと記録表がペアになることを確認"""
+        validator = ReviewValidator()
+        validator.add_file(_checklist("B"), "checklist")
+        validator.add_file(_record("A"), "record")
+        validator.add_file(_checklist("A"), "checklist")
+
+        results = validator.validate_all()
+
+        assert [result["project_name"] for result in results] == ["A", "B"]
+        assert results[0]["validation"]["has_pair"] is True
+        assert results[1]["validation"]["status"] == "⚠️ 記録表なし"
+
+    def test_pairsは直接変更できない(self):
+        """pairs は読み取り専用で、validate_all の順序と食い違わないことを確認"""
+        validator = ReviewValidator()
+        validator.add_file(_checklist("B"), "checklist")
+
+        with pytest.raises(TypeError):
+            validator.pairs["A"] = ReviewPair("A")
+        with pytest.raises(TypeError):
+            del validator.pairs["B"]
+
+        validator.add_file(_checklist("A"), "checklist")
+
+        assert list(validator.pairs) == ["B", "A"]
+        assert [result["project_name"] for result in validator.validate_all()] == ["A", "B"]
+
+    def test_ラベルの位置の辞書はファイルデータに格納しない(self):
+        """cell_label_index を持たないファイルデータを追加しても、呼び出し元の辞書を変更しないことを確認"""
+        validator = ReviewValidator()
+        checklist = _checklist("A")
+        original = dict(checklist)
+
+        validator.add_file(checklist, "checklist")
+
+        assert checklist == original
+        assert validator.pairs["A"].checklist is checklist
+        assert get_label_index(checklist) == {"プロジェクト名": 0, "日付": 1, "担当者": 2}
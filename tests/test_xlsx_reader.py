@@ -0,0 +1,130 @@
+"""XLSX軽量読み込み機能のテスト"""
+import datetime
+import zipfile
+import pytest
+import openpyxl
+from pathlib import Path
+from src.xlsx_reader import XlsxReader
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestXlsxReader:
+    """XlsxReaderクラスのテスト"""
+
+    @pytest.fixture
+    def typed_workbook(self, tmp_path):
+        """共有文字列・日付・真偽値・数式を含むワークブックを作成"""
+        file_path = tmp_path / "typed.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "データ"
+        sheet["A1"] = "プロジェクトA"
+        sheet["B1"] = datetime.datetime(2025, 1, 15)
+        sheet["C1"] = True
+        sheet["D1"] = 12
+        sheet["E1"] = 1.5
+        sheet["A2"] = "=1+2"
+        workbook.create_sheet("Sheet2")["A1"] = "Sheet2_A1"
+        workbook.save(file_path)
+        return file_path
+
+    def test_openpyxlと同じ値を読み込める(self, typed_workbook):
+        """各データ型の値がopenpyxl(data_only=True)と同じ値で読み込めることを確認"""
+        cells = ["A1", "B1", "C1", "D1", "E1", "A2", "Z99"]
+
+        with XlsxReader(typed_workbook) as reader:
+            values = reader.read_cells(cells)
+
+        workbook = openpyxl.load_workbook(typed_workbook, data_only=True)
+        expected = [workbook.worksheets[0][cell].value for cell in cells]
+        workbook.close()
+
+        assert values == expected
+
+    def test_シート名を指定して読み込める(self, typed_workbook):
+        """シート名を指定した場合、そのシートの値を読み込めることを確認"""
+        with XlsxReader(typed_workbook) as reader:
+            assert reader.sheet_names == ["データ", "Sheet2"]
+            assert reader.read_cells(["A1"], "Sheet2") == ["Sheet2_A1"]
+
+    def test_存在しないシートはエラー(self, typed_workbook):
+        """存在しないシート名を指定した場合、KeyErrorが発生することを確認"""
+        with XlsxReader(typed_workbook) as reader:
+            with pytest.raises(KeyError):
+                reader.read_cells(["A1"], "NoSheet")
+
+    def test_不正なセル座標はNoneを返す(self):
+        """不正なセル座標を指定した場合、Noneを返すことを確認"""
+        with XlsxReader(FIXTURES_DIR / "test_data.xlsx") as reader:
+            values = reader.read_cells(["A1", "bad", "C1"])
+
+        assert values == ["2023/12/25", None, "確定"]
+
+    def test_ZIP形式でないファイルはエラー(self):
+        """XLSX(ZIP)形式でないファイルの場合、エラーが発生することを確認"""
+        with pytest.raises(Exception):
+            XlsxReader(FIXTURES_DIR / "test_data.csv")
+
+    def test_同じ共有文字列テーブルは再利用される(self, tmp_path):
+        """共有文字列が同一のファイル間では解析済みのテーブルが再利用されることを確認"""
+        file_paths = []
+        for name in ("first.xlsx", "second.xlsx"):
+            workbook = openpyxl.Workbook()
+            workbook.active["A1"] = "承認者"
+            workbook.active["A2"] = "担当者"
+            file_path = tmp_path / name
+            workbook.save(file_path)
+            file_paths.append(file_path)
+
+        tables = []
+        for file_path in file_paths:
+            with XlsxReader(file_path) as reader:
+                assert reader.read_cells(["A1", "A2"]) == ["承認者", "担当者"]
+                tables.append(reader._get_shared_strings())
+
+        assert tables[0] is tables[1]
+
+    def test_r属性が省略されたセルも読み込める(self, tmp_path):
+        """行・セルのr属性が省略されたシートでも位置を補完して読み込めることを確認"""
+        source_path = tmp_path / "source.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet["A1"] = 1
+        sheet["B1"] = 2
+        sheet["A2"] = 3
+        sheet["C2"] = 4
+        workbook.save(source_path)
+
+        # シートXMLから行・セルのr属性を取り除く（C2は位置を残す）
+        file_path = tmp_path / "no_ref.xlsx"
+        with zipfile.ZipFile(source_path) as src, zipfile.ZipFile(file_path, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    text = data.decode("utf-8")
+                    for ref in ('r="1"', 'r="2"', 'r="A1"', 'r="B1"', 'r="A2"'):
+                        text = text.replace(" " + ref, "")
+                    data = text.encode("utf-8")
+                dst.writestr(item, data)
+
+        with XlsxReader(file_path) as reader:
+            assert reader.read_cells(["A1", "B1", "A2", "B2", "C2"]) == [1, 2, 3, None, 4]
+
+    def test_画像のアンカー位置をシートごとに読み込める(self):
+        """描画パーツから画像の開始セルを読み込み、openpyxlと一致することを確認"""
+        file_path = FIXTURES_DIR / "multi_sheet_with_images.xlsx"
+        workbook = openpyxl.load_workbook(file_path)
+        try:
+            with XlsxReader(file_path) as reader:
+                for sheet in workbook.worksheets:
+                    expected = {
+                        (image.anchor._from.row, image.anchor._from.col)
+                        for image in sheet._images
+                    }
+                    assert reader.read_image_anchors(sheet.title) == expected
+                assert reader.read_image_anchors() == set()
+                assert reader.read_image_anchors("Sheet2") == {(0, 3)}
+        finally:
+            workbook.close()